@@ -3,44 +3,131 @@ Database module for WOTSON Agent.
 Handles all interactions with the SQLite database.
 """
 
+import atexit
 import sqlite3
-import json
+import threading
 from typing import List, Dict, Any
 from pathlib import Path
-from datetime import datetime, timedelta
 
 from utils.config import CONFIG
 
 DB_PATH = Path(CONFIG["paths"]["data_root"]) / "wotson.db"
 
+# Each process shares one long-lived connection across all its calls, with at
+# most one writer per process: the agent stores messages from its drain task,
+# while the scheduler only reads. Across processes, WAL mode lets the agent's
+# writes and the scheduler's reads run side by side. The shared connection also
+# keeps SQLite's page cache warm between calls.
+_conn = None
+_conn_lock = threading.Lock()
+
+# Query text is kept in module-level constants so every call hands sqlite3 the
+# identical string and hits the connection's prepared-statement cache. Because
+# the connection lives for the whole process, these hot statements are prepared
+# once and stay alive across calls; the one-shot DDL in initialize_database is
+# the only thing prepared and thrown away.
+# Duplicate deliveries of a message are ignored rather than replaced, so the
+# stored row (and any category already set on it) is kept as-is.
+_SQL_INSERT_MSG = """
+    INSERT INTO WhatsAppMessages (id, group_id, sender_id, content, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO NOTHING
+"""
+
+_SQL_INSERT_GROUP = """
+    INSERT INTO WhatsAppGroups (id, name)
+    VALUES (?, ?)
+    ON CONFLICT(id) DO UPDATE SET name = COALESCE(NULLIF(excluded.name, ''), name)
+"""
+
+# Question detection is evaluated by SQLite as a generated column so the
+# unanswered-questions scan can use a small partial index instead of running
+# leading-wildcard LIKEs over every message.
+_IS_QUESTION_EXPR = """(
+    content LIKE '%?' OR
+    LOWER(content) LIKE 'who %' OR
+    LOWER(content) LIKE 'what %' OR
+    LOWER(content) LIKE 'when %' OR
+    LOWER(content) LIKE 'where %' OR
+    LOWER(content) LIKE 'why %' OR
+    LOWER(content) LIKE 'how %'
+)"""
+
+_SQL_UNANSWERED = """
+    SELECT id AS message_id, group_id, content FROM WhatsAppMessages
+    WHERE is_question = 1
+    AND category IS NULL
+    AND timestamp >= datetime('now', '-24 hours')
+"""
+
+_SQL_UPCOMING_EVENTS = """
+    SELECT E.*, G.id as group_id
+    FROM Events E
+    JOIN WhatsAppGroups G ON G.event_id = E.id
+    WHERE E.date BETWEEN date('now', 'localtime') AND date('now', 'localtime', ?)
+"""
+
+_SQL_GROUP_SILENCE = """
+    SELECT G.id as group_id, E.name as event_name, MAX(M.timestamp) as last_msg
+    FROM WhatsAppGroups G
+    JOIN WhatsAppMessages M ON G.id = M.group_id
+    JOIN Events E ON G.event_id = E.id
+    GROUP BY G.id
+    HAVING MAX(M.timestamp) < datetime('now', ?)
+"""
+
 def get_conn():
-    """Establishes and returns a connection to the SQLite database."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Returns the shared connection to the SQLite database, opening it on first use."""
+    global _conn
+    if _conn is None:
+        with _conn_lock:
+            if _conn is None:
+                DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL;")
+                conn.execute("PRAGMA synchronous=NORMAL;")
+                conn.execute("PRAGMA temp_store=MEMORY;")
+                conn.execute("PRAGMA cache_size=-64000;")
+                conn.execute("PRAGMA mmap_size=268435456;")
+                atexit.register(_close_conn, conn)
+                _conn = conn
+    return _conn
+
+def _close_conn(conn: sqlite3.Connection):
+    """Refreshes planner statistics and closes the connection at interpreter exit."""
+    try:
+        conn.execute("PRAGMA optimize;")
+    finally:
+        conn.close()
 
 def initialize_database():
     """Creates the necessary database tables if they don't already exist."""
     with get_conn() as conn:
-        conn.execute("""
+        # Databases created before is_question existed need the column added
+        # before the partial index below can reference it
+        columns = {row["name"] for row in conn.execute("PRAGMA table_xinfo(WhatsAppMessages);")}
+        if columns and "is_question" not in columns:
+            conn.execute(
+                "ALTER TABLE WhatsAppMessages ADD COLUMN is_question INTEGER "
+                f"GENERATED ALWAYS AS {_IS_QUESTION_EXPR} VIRTUAL;"
+            )
+
+        # All tables and indexes are created in a single script
+        conn.executescript(f"""
         CREATE TABLE IF NOT EXISTS Events (
             id TEXT PRIMARY KEY,
             name TEXT NOT NULL,
             date TEXT NOT NULL
         );
-        """)
 
-        conn.execute("""
         CREATE TABLE IF NOT EXISTS WhatsAppGroups (
             id TEXT PRIMARY KEY,
             name TEXT,
             event_id TEXT,
             FOREIGN KEY (event_id) REFERENCES Events(id)
         );
-        """)
-        
-        conn.execute("""
+
         CREATE TABLE IF NOT EXISTS WhatsAppMessages (
             id TEXT PRIMARY KEY,
             group_id TEXT NOT NULL,
@@ -48,62 +135,71 @@ def initialize_database():
             content TEXT,
             timestamp DATETIME,
             category TEXT, -- e.g., 'question', 'answered'
+            is_question INTEGER GENERATED ALWAYS AS {_IS_QUESTION_EXPR} VIRTUAL,
             FOREIGN KEY (group_id) REFERENCES WhatsAppGroups(id)
         );
+
+        -- Add indexes for performance
+        CREATE INDEX IF NOT EXISTS idx_messages_group_timestamp ON WhatsAppMessages (group_id, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_messages_category ON WhatsAppMessages (category);
+        CREATE INDEX IF NOT EXISTS idx_groups_event_id ON WhatsAppGroups (event_id);
+        -- Covering index for the upcoming-events range scan (date, plus the columns it returns)
+        CREATE INDEX IF NOT EXISTS idx_events_date ON Events (date, id, name);
+        CREATE INDEX IF NOT EXISTS idx_msg_unanswered ON WhatsAppMessages (timestamp)
+            WHERE is_question = 1 AND category IS NULL;
         """)
 
-        # Add indexes for performance
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_group_timestamp ON WhatsAppMessages (group_id, timestamp);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_category ON WhatsAppMessages (category);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_groups_event_id ON WhatsAppGroups (event_id);")
+        # Gather statistics for any index that lacks them, with a bounded
+        # analysis limit so this stays cheap on large databases
+        conn.execute("PRAGMA optimize=0x10002;")
 
-        conn.commit()
         print("Database initialized successfully with new schema and indexes.")
 
+def optimize_database():
+    """
+    Re-runs ANALYZE where SQLite judges the statistics to be stale.
+    The scheduler process is long-lived, so this is called periodically.
+    """
+    get_conn().execute("PRAGMA optimize;")
+
+def log_message(message: Dict[str, Any]):
+    """Stores a single incoming WhatsApp message."""
+    log_messages([message])
+
+def log_messages(messages: List[Dict[str, Any]]):
+    """
+    Stores a batch of incoming WhatsApp messages in a single transaction.
+
+    Each message is a dict with 'message_id', 'group_id', 'group_name',
+    'sender', 'content' and 'timestamp' keys.
+    """
+    if not messages:
+        return
+    with get_conn() as conn:
+        conn.executemany(_SQL_INSERT_GROUP, [
+            (m["group_id"], m.get("group_name")) for m in messages
+        ])
+        conn.executemany(_SQL_INSERT_MSG, [
+            (m["message_id"], m["group_id"], m.get("sender"), m.get("content"), m.get("timestamp"))
+            for m in messages
+        ])
+
 def get_unanswered_questions() -> list:
     """
     Fetches all messages that look like questions and haven't been answered.
     """
     with get_conn() as conn:
-        # This query is improved to be more robust than a simple LIKE check.
-        rows = conn.execute("""
-            SELECT * FROM WhatsAppMessages
-            WHERE (
-                content LIKE '%?' OR
-                LOWER(content) LIKE 'who %' OR
-                LOWER(content) LIKE 'what %' OR
-                LOWER(content) LIKE 'when %' OR
-                LOWER(content) LIKE 'where %' OR
-                LOWER(content) LIKE 'why %' OR
-                LOWER(content) LIKE 'how %'
-            )
-            AND category IS NULL
-            AND timestamp >= datetime('now', '-24 hours')
-        """)
-        return [dict(row) for row in rows.fetchall()]
+        rows = conn.execute(_SQL_UNANSWERED)
+        return rows.fetchall()
 
 def get_upcoming_events(within_days=3) -> list:
     """Fetches events that are coming up within a given number of days."""
     with get_conn() as conn:
-        now = datetime.now()
-        upcoming = (now + timedelta(days=within_days)).strftime('%Y-%m-%d')
-        rows = conn.execute("""
-            SELECT E.*, G.id as group_id
-            FROM Events E
-            JOIN WhatsAppGroups G ON G.event_id = E.id
-            WHERE E.date BETWEEN ? AND ?
-        """, (now.strftime('%Y-%m-%d'), upcoming))
-        return [dict(row) for row in rows.fetchall()]
+        rows = conn.execute(_SQL_UPCOMING_EVENTS, (f"+{int(within_days)} days",))
+        return rows.fetchall()
 
 def get_group_silence_state(hours=8) -> list:
     """Finds groups that have been silent for a given number of hours."""
     with get_conn() as conn:
-        rows = conn.execute("""
-            SELECT G.id as group_id, E.name as event_name, MAX(M.timestamp) as last_msg
-            FROM WhatsAppGroups G
-            JOIN WhatsAppMessages M ON G.id = M.group_id
-            JOIN Events E ON G.event_id = E.id
-            GROUP BY G.id
-            HAVING (strftime('%s', 'now') - strftime('%s', M.timestamp)) > (? * 3600)
-        """, (hours,))
-        return [dict(row) for row in rows.fetchall()] 
\ No newline at end of file
+        rows = conn.execute(_SQL_GROUP_SILENCE, (f"-{int(hours)} hours",))
+        return rows.fetchall() 
\ No newline at end of file
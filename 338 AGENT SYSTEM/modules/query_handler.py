@@ -4,6 +4,7 @@ This module is responsible for processing incoming WhatsApp messages,
 determining the appropriate action, and returning a result to the main agent.
 """
 
+from functools import lru_cache
 from typing import Dict, Any
 
 def handle_message_query(message: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,7 +12,8 @@ def handle_message_query(message: Dict[str, Any], config: Dict[str, Any]) -> Dic
     Processes a WhatsApp message and decides on the next action.
 
     Args:
-        message: A dictionary representing the WhatsApp message.
+        message: A mapping representing the WhatsApp message (a dict or a
+                 sqlite3.Row) with at least 'message_id' and 'content' keys.
         config: The application's configuration dictionary.
 
     Returns:
@@ -26,16 +28,17 @@ def handle_message_query(message: Dict[str, Any], config: Dict[str, Any]) -> Dic
     urgency_score = _calculate_message_urgency(message, config)
 
     action = "log"
-    details = f"Processed message {message.get('message_id')} with urgency {urgency_score:.2f}."
+    message_id = message["message_id"]
+    details = f"Processed message {message_id} with urgency {urgency_score:.2f}."
 
     if urgency_score > urgency_threshold:
         action = "escalate"
-        details = f"Urgent message {message.get('message_id')} detected with score {urgency_score:.2f}."
+        details = f"Urgent message {message_id} detected with score {urgency_score:.2f}."
 
     return {
         "action": action,
         "details": details,
-        "message_id": message.get("message_id"),
+        "message_id": message_id,
         "urgency_score": urgency_score,
     }
 
@@ -44,7 +47,15 @@ def _calculate_message_urgency(message: Dict[str, Any], config: Dict[str, Any])
     Placeholder for urgency calculation logic.
     In a real scenario, this would use the urgency patterns from the config.
     """
+    return _score_content_urgency(message["content"] or "")
+
+@lru_cache(maxsize=4096)
+def _score_content_urgency(content: str) -> float:
+    """
+    Scores the urgency of a message body. The score depends only on the text,
+    so reposted or duplicate questions are answered from the cache.
+    """
     # Simple example: if "urgent" is in the message, score is high.
-    if "urgent" in message.get("content", "").lower():
+    if "urgent" in content.lower():
         return 0.9
     return 0.1 
\ No newline at end of file
@@ -6,17 +6,35 @@ checking for unanswered questions, sending event reminders, and monitoring
 group activity.
 """
 
-import datetime
-from typing import List, Dict, Any
+import asyncio
+import time
+from typing import List, Dict, Any, Awaitable
 
 from utils.config import CONFIG
 from modules.query_handler import handle_message_query
-from db.database import get_unanswered_questions, get_upcoming_events, get_group_silence_state
+from db.database import get_unanswered_questions, get_upcoming_events, get_group_silence_state, optimize_database
 from modules.whatsapp_service import send_group_message, send_private_message
 
+# --- Message Templates ---
+
+_AUTO_REPLY_MESSAGE = "Hi! Based on our knowledge base, the answer to your question might be: [Automated Answer Placeholder]. If this isn't right, an admin will assist shortly."
+_ADMIN_FORWARD_TEMPLATE = "An unanswered question in a group needs your attention: '{content}'"
+_REMINDER_TEMPLATE = "🔔 REMINDER: The event '{name}' is scheduled to start soon."
+_CHECK_IN_TEMPLATE = "👋 Just checking in! It's been a bit quiet in the '{event_name}' group. Is everything running smoothly?"
+
+# --- Helpers ---
+
+async def _send_all(sends: List[Awaitable[None]]):
+    """
+    Awaits a batch of bridge sends concurrently.
+    The send functions handle their own errors, so one failure does not stop the rest.
+    """
+    if sends:
+        await asyncio.gather(*sends)
+
 # --- Core Scheduler Functions ---
 
-def scan_unanswered_questions():
+async def scan_unanswered_questions():
     """
     Scans for unanswered questions, categorizes them, and takes action.
     """
@@ -28,21 +46,23 @@ def scan_unanswered_questions():
         print("SCHEDULER: No unanswered questions found.")
         return
 
+    sends = []
     for question in questions:
         # Use the query handler to assess the question
         result = handle_message_query(question, CONFIG)
         
         if result["urgency_score"] >= reply_threshold:
             # High confidence, auto-reply
-            response = f"Hi! Based on our knowledge base, the answer to your question might be: [Automated Answer Placeholder]. If this isn't right, an admin will assist shortly."
-            send_group_message(question["group_id"], response)
+            sends.append(send_group_message(question["group_id"], _AUTO_REPLY_MESSAGE))
         else:
             # Low confidence, forward to admin
+            message = _ADMIN_FORWARD_TEMPLATE.format(content=question["content"])
             for admin_id in admin_ids:
-                message = f"An unanswered question in a group needs your attention: '{question['content']}'"
-                send_private_message(admin_id, message)
+                sends.append(send_private_message(admin_id, message))
+    
+    await _send_all(sends)
 
-def send_event_reminders():
+async def send_event_reminders():
     """
     Sends reminders for events starting soon.
     """
@@ -53,11 +73,18 @@ def send_event_reminders():
         print("SCHEDULER: No upcoming events to send reminders for.")
         return
 
+    # One row is returned per (event, group); build each event's reminder once
+    reminder_messages = {}
+    sends = []
     for event in events:
-        reminder_message = f"🔔 REMINDER: The event '{event['name']}' is scheduled to start soon."
-        send_group_message(event["group_id"], reminder_message)
+        reminder_message = reminder_messages.get(event["id"])
+        if reminder_message is None:
+            reminder_message = reminder_messages[event["id"]] = _REMINDER_TEMPLATE.format(name=event["name"])
+        sends.append(send_group_message(event["group_id"], reminder_message))
+    
+    await _send_all(sends)
 
-def check_group_inactivity():
+async def check_group_inactivity():
     """
     Detects inactive groups and sends a check-in message.
     """
@@ -68,17 +95,44 @@ def check_group_inactivity():
         print("SCHEDULER: No inactive groups found.")
         return
 
+    # Groups of the same event share one check-in message
+    check_in_messages = {}
+    sends = []
     for group in silent_groups:
-        check_in_message = f"👋 Just checking in! It's been a bit quiet in the '{group['event_name']}' group. Is everything running smoothly?"
-        send_group_message(group["group_id"], check_in_message)
+        check_in_message = check_in_messages.get(group["event_name"])
+        if check_in_message is None:
+            check_in_message = check_in_messages[group["event_name"]] = _CHECK_IN_TEMPLATE.format(event_name=group["event_name"])
+        sends.append(send_group_message(group["group_id"], check_in_message))
+    
+    await _send_all(sends)
+
+# Planner statistics only need refreshing once a day
+_OPTIMIZE_INTERVAL_SECONDS = 24 * 3600
+_last_optimize = None
+
+async def optimize_database_daily():
+    """
+    Task 4: Keep SQLite's query planner statistics up to date.
+    Runs PRAGMA optimize at most once every 24 hours.
+    """
+    global _last_optimize
+    now = time.monotonic()
+    if _last_optimize is not None and now - _last_optimize < _OPTIMIZE_INTERVAL_SECONDS:
+        return
+    print("Running daily database optimization...")
+    optimize_database()
+    _last_optimize = now
 
-def run_all_scheduled_tasks():
+async def run_all_scheduled_tasks():
     """
-    The main entry point to run all scheduled tasks sequentially.
-    This would typically be called by a scheduler (e.g., cron, APScheduler).
+    The main entry point to run all scheduled tasks concurrently.
+    This is awaited periodically by the scheduler loop in run_scheduler.py.
     """
     print("\n--- Running Scheduled Tasks ---")
-    scan_unanswered_questions()
-    send_event_reminders()
-    check_group_inactivity()
+    await asyncio.gather(
+        scan_unanswered_questions(),
+        send_event_reminders(),
+        check_group_inactivity(),
+        optimize_database_daily(),
+    )
     print("--- Scheduled Tasks Complete ---\n") 
\ No newline at end of file
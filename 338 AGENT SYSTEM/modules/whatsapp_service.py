@@ -4,12 +4,36 @@ This module is a placeholder for the actual WhatsApp integration.
 It provides a consistent interface for sending messages, which can be
 backed by any WhatsApp API or bridge (e.g., wweb.js, Baileys, etc.).
 """
-import requests
+import aiohttp
 from utils.config import CONFIG
 
 WHATSAPP_API = CONFIG['whatsapp'].get('webhook_url', 'http://localhost:5001/send')
 
-def send_group_message(group_id: str, message: str):
+# Maximum number of messages sent to the bridge at the same time
+MAX_CONCURRENT_SENDS = 32
+
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Shared session so every send reuses a pooled keep-alive connection to the bridge.
+# It is created on first use because aiohttp sessions must be bound to a running loop.
+_session = None
+
+def _get_session() -> aiohttp.ClientSession:
+    """Returns the shared bridge session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_SENDS, keepalive_timeout=30)
+        _session = aiohttp.ClientSession(connector=connector, timeout=_REQUEST_TIMEOUT)
+    return _session
+
+async def close_session():
+    """Closes the shared bridge session. Call once when the event loop shuts down."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+async def send_group_message(group_id: str, message: str):
     """Send a message to a WhatsApp group via the bridge."""
     payload = {
         "to": group_id,
@@ -17,13 +41,13 @@ def send_group_message(group_id: str, message: str):
         "message": message,
     }
     try:
-        res = requests.post(WHATSAPP_API, json=payload, timeout=10)
-        res.raise_for_status()
+        async with _get_session().post(WHATSAPP_API, json=payload) as res:
+            res.raise_for_status()
         print(f"Sent to group {group_id}: {message}")
     except Exception as e:
         print(f"Failed to send group message: {e}")
 
-def send_private_message(user_id: str, message: str):
+async def send_private_message(user_id: str, message: str):
     """Send a direct message to a user via the bridge."""
     payload = {
         "to": user_id,
@@ -31,8 +55,8 @@ def send_private_message(user_id: str, message: str):
         "message": message,
     }
     try:
-        res = requests.post(WHATSAPP_API, json=payload, timeout=10)
-        res.raise_for_status()
+        async with _get_session().post(WHATSAPP_API, json=payload) as res:
+            res.raise_for_status()
         print(f"Sent DM to {user_id}: {message}")
     except Exception as e:
-        print(f"Failed to send DM: {e}") 
\ No newline at end of file
+        print(f"Failed to send DM: {e}")
@@ -1,9 +1,20 @@
-import time
-import schedule
+import asyncio
 from modules.scheduled_tasks import run_all_scheduled_tasks
+from modules.whatsapp_service import close_session
 from utils.config import CONFIG
 from db.database import initialize_database
 
+async def run_periodically(run_interval: int):
+    """
+    Runs all scheduled tasks once immediately, then every run_interval hours.
+    """
+    try:
+        while True:
+            await run_all_scheduled_tasks()
+            await asyncio.sleep(run_interval * 3600)
+    finally:
+        await close_session()
+
 def main():
     """
     Main function to set up and run the scheduled tasks for WOTSON.
@@ -21,15 +32,8 @@ def main():
     print(f"Running all tasks every {run_interval} hours.")
     print("Press Ctrl+C to stop the scheduler.")
 
-    # Run once immediately at startup for testing
-    run_all_scheduled_tasks()
-
-    # Schedule the tasks to run periodically
-    schedule.every(run_interval).hours.do(run_all_scheduled_tasks)
-
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    # Run once immediately at startup for testing, then periodically
+    asyncio.run(run_periodically(run_interval))
 
 if __name__ == "__main__":
     # To run this, you first need to install the dependencies:
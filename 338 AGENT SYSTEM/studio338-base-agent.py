@@ -9,12 +9,31 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass
 from datetime import datetime
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
 import asyncio
+import hashlib
 import logging
 from enum import Enum
 import json
+import time
 import uuid
 
+# Context timestamps are refreshed at most once per millisecond, so bursts of
+# messages and tool calls share one formatted string
+_TIMESTAMP_REFRESH_NS = 1_000_000
+_cached_timestamp = ""
+_cached_timestamp_ns = -_TIMESTAMP_REFRESH_NS
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, cached for up to a millisecond."""
+    global _cached_timestamp, _cached_timestamp_ns
+    now_ns = time.monotonic_ns()
+    if now_ns - _cached_timestamp_ns >= _TIMESTAMP_REFRESH_NS:
+        _cached_timestamp = datetime.utcnow().isoformat()
+        _cached_timestamp_ns = now_ns
+    return _cached_timestamp
+
 class AgentType(Enum):
     """Types of agents in the Studio338 system"""
     EMAIL_LEARNING = "email_learning"
@@ -78,16 +97,34 @@ class BaseAgent(ABC):
         
         # Knowledge and state management
         self.knowledge_base: Dict[str, KnowledgeEntity] = {}
+        
+        # Inverted index of content tokens to entity IDs, so queries only
+        # look at entities that share at least one word with the query
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)
+        self._entity_tokens: Dict[str, frozenset] = {}
+        # Position of each entity in knowledge_base, so index lookups keep insertion order
+        self._entity_order: Dict[str, int] = {}
+        # SHA-256 of the indexed content, used to skip re-tokenizing unchanged entities
+        self._entity_content_hashes: Dict[str, bytes] = {}
+        # Entities grouped by venue_context["event_id"], for relationship lookups
+        self._venue_event_index: Dict[Any, Set[str]] = defaultdict(set)
+        self._entity_venue_keys: Dict[str, Any] = {}
         self.active_tasks: Dict[str, A2ATask] = {}
         self.performance_metrics = {
             "tasks_processed": 0,
             "tasks_succeeded": 0,
             "tasks_failed": 0,
             "avg_response_time": 0.0,
+            "response_time_variance": 0.0,
             "tool_invocations": 0,
             "knowledge_entities_created": 0
         }
         
+        # Running response-time statistics (Welford's algorithm)
+        self._response_time_count = 0
+        self._response_time_mean = 0.0
+        self._response_time_m2 = 0.0
+        
         # Protocol managers (initialized in subclasses)
         self.a2a_manager = None  # Handles agent-to-agent communication
         self.mcp_manager = None  # Handles tool access and resource management
@@ -104,8 +141,10 @@ class BaseAgent(ABC):
         self.logger = logging.getLogger(f"agent.{agent_id}")
         self.logger.setLevel(logging.INFO)
         
-        # Decision logging for transparency
-        self.decision_log: List[Dict[str, Any]] = []
+        # Decision logging for transparency. Only the most recent entries are
+        # kept in memory; older ones are appended to the archive file if configured
+        self.decision_log: deque = deque(maxlen=config.get("decision_log_max", 10_000))
+        self.decision_log_archive: Optional[str] = config.get("decision_log_archive")
         
     @abstractmethod
     async def process_task(self, task: A2ATask) -> Dict[str, Any]:
@@ -146,7 +185,7 @@ class BaseAgent(ABC):
         
         # Create task with unique ID and context
         task = A2ATask(
-            id=f"{self.agent_id}_{datetime.utcnow().isoformat()}_{uuid.uuid4().hex[:8]}",
+            id=f"{self.agent_id}_{utc_now_iso()}_{uuid.uuid4().hex[:8]}",
             skill_id=skill_id,
             agent_id=target_agent,
             parameters=parameters,
@@ -183,7 +222,7 @@ class BaseAgent(ABC):
         broadcast_message = {
             "type": "knowledge_sharing",
             "source_agent": self.agent_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "entities": [self._serialize_knowledge_entity(entity) for entity in knowledge_entities],
             "confidence_threshold": self.config.get("knowledge_sharing_threshold", 0.7)
         }
@@ -236,35 +275,71 @@ class BaseAgent(ABC):
         """
         Query the agent's knowledge base with semantic search capabilities.
         """
-        relevant_entities = []
+        query_words = self._tokenize(query)
+        required_overlap = min(3, len(query_words) // 2)
+        
+        overlap_counts = None
+        if required_overlap == 0:
+            # Very short queries match every entity, so there is nothing to narrow down
+            candidates = self.knowledge_base.keys()
+        else:
+            # Count shared words per entity straight from the posting lists
+            overlap_counts = Counter()
+            for word in query_words:
+                overlap_counts.update(self._token_index.get(word, ()))
+            candidates = sorted(
+                (entity_id for entity_id, overlap in overlap_counts.items()
+                 if overlap >= required_overlap),
+                key=self._entity_order.__getitem__
+            )
         
-        for entity in self.knowledge_base.values():
+        relevant_entities = []
+        for entity_id in candidates:
+            entity = self.knowledge_base[entity_id]
             if entity.confidence_score >= confidence_threshold:
-                if await self._is_relevant_to_query(entity, query, context):
-                    relevant_entities.append(entity)
-        
-        # Sort by relevance and confidence
-        return sorted(
-            relevant_entities, 
-            key=lambda x: (x.confidence_score, self._calculate_relevance_score(x, query)),
-            reverse=True
-        )
+                relevant_entities.append(entity)
+        
+        # Sort by relevance and confidence, reusing the overlap counts gathered above
+        def sort_key(entity: KnowledgeEntity):
+            overlap = overlap_counts[entity.entity_id] if overlap_counts is not None else None
+            return (entity.confidence_score, self._calculate_relevance_score(entity, query, overlap))
+        
+        return sorted(relevant_entities, key=sort_key, reverse=True)
     
     async def update_knowledge(self, entity: KnowledgeEntity) -> None:
         """
         Update or add knowledge entity with proper validation and indexing.
         """
-        # Validate entity before storage
-        if await self._validate_knowledge_entity(entity):
+        await self.update_knowledge_batch([entity])
+    
+    async def update_knowledge_batch(self, entities: List[KnowledgeEntity]) -> None:
+        """
+        Update or add several knowledge entities at once.
+        High-confidence entities are shared in a single broadcast instead of one per entity.
+        """
+        auto_share_threshold = self.config.get("auto_share_threshold", 0.8)
+        to_share = []
+        
+        for entity in entities:
+            # Validate entity before storage
+            if not await self._validate_knowledge_entity(entity):
+                continue
+            
             self.knowledge_base[entity.entity_id] = entity
+            self._entity_order.setdefault(entity.entity_id, len(self._entity_order))
+            self._index_entity_tokens(entity)
+            self._index_entity_venue(entity)
             self.performance_metrics["knowledge_entities_created"] += 1
             
             # Update relationships and cross-references
             await self._update_knowledge_relationships(entity)
             
             # Consider sharing with other agents if confidence is high
-            if entity.confidence_score >= self.config.get("auto_share_threshold", 0.8):
-                await self.broadcast_knowledge([entity])
+            if entity.confidence_score >= auto_share_threshold:
+                to_share.append(entity)
+        
+        if to_share:
+            await self.broadcast_knowledge(to_share)
     
     # Performance and Monitoring Methods
     async def get_performance_metrics(self) -> Dict[str, Any]:
@@ -285,7 +360,7 @@ class BaseAgent(ABC):
         return {
             "source_agent": self.agent_id,
             "agent_type": self.agent_type.value,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "knowledge_scope": list(self.knowledge_base.keys())[:10],  # Sample of knowledge
             "performance_summary": {
                 "success_rate": self._calculate_success_rate(),
@@ -299,7 +374,7 @@ class BaseAgent(ABC):
             "requesting_agent": self.agent_id,
             "agent_type": self.agent_type.value,
             "security_context": self.security_context,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
     
     def _log_decision(self, decision_type: str, description: str, details: Dict[str, Any]):
@@ -311,9 +386,23 @@ class BaseAgent(ABC):
             "details": details,
             "agent_id": self.agent_id
         }
+        if len(self.decision_log) == self.decision_log.maxlen and self.decision_log_archive:
+            self._archive_decision(self.decision_log[0])
         self.decision_log.append(decision_entry)
         self.logger.info(f"Decision logged: {description}")
     
+    def _archive_decision(self, decision_entry: Dict[str, Any]):
+        """Append a decision that is about to be evicted from memory to the JSONL archive."""
+        try:
+            with open(self.decision_log_archive, "a") as f:
+                f.write(json.dumps(decision_entry, default=str) + "\n")
+        except OSError as e:
+            self.logger.error(f"Failed to archive decision log entry: {e}")
+    
+    def get_decision_log(self) -> List[Dict[str, Any]]:
+        """Get the in-memory decision log for audit purposes."""
+        return list(self.decision_log)
+    
     def _update_performance_metrics(self, start_time: datetime, success: bool):
         """Update performance metrics after task completion."""
         duration = (datetime.utcnow() - start_time).total_seconds()
@@ -324,12 +413,17 @@ class BaseAgent(ABC):
         else:
             self.performance_metrics["tasks_failed"] += 1
         
-        # Update average response time
-        current_avg = self.performance_metrics["avg_response_time"]
-        total_tasks = self.performance_metrics["tasks_processed"]
-        self.performance_metrics["avg_response_time"] = (
-            (current_avg * (total_tasks - 1) + duration) / total_tasks
-        )
+        # Update response time mean and variance incrementally
+        self._response_time_count += 1
+        delta = duration - self._response_time_mean
+        self._response_time_mean += delta / self._response_time_count
+        self._response_time_m2 += delta * (duration - self._response_time_mean)
+        
+        self.performance_metrics["avg_response_time"] = self._response_time_mean
+        if self._response_time_count > 1:
+            self.performance_metrics["response_time_variance"] = (
+                self._response_time_m2 / (self._response_time_count - 1)
+            )
     
     def _calculate_success_rate(self) -> float:
         """Calculate the agent's task success rate."""
@@ -338,6 +432,54 @@ class BaseAgent(ABC):
             return 0.0
         return self.performance_metrics["tasks_succeeded"] / total
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _tokenize(text: str) -> frozenset:
+        """Split text into the lowercased word set used for keyword matching."""
+        return frozenset(text.lower().split())
+    
+    def _entity_token_set(self, entity: KnowledgeEntity) -> frozenset:
+        """Return an entity's word set, reusing the indexed copy for stored entities."""
+        if self.knowledge_base.get(entity.entity_id) is entity:
+            tokens = self._entity_tokens.get(entity.entity_id)
+            if tokens is not None:
+                return tokens
+        return self._tokenize(entity.content)
+    
+    def _index_entity_tokens(self, entity: KnowledgeEntity) -> None:
+        """Add an entity's content words to the inverted index, replacing any previous entry."""
+        entity_id = entity.entity_id
+        content_hash = hashlib.sha256(entity.content.encode()).digest()
+        if self._entity_content_hashes.get(entity_id) == content_hash:
+            return
+        self._entity_content_hashes[entity_id] = content_hash
+        
+        for word in self._entity_tokens.get(entity_id, ()):
+            postings = self._token_index[word]
+            postings.discard(entity_id)
+            if not postings:
+                del self._token_index[word]
+        
+        tokens = self._tokenize(entity.content)
+        self._entity_tokens[entity_id] = tokens
+        for word in tokens:
+            self._token_index[word].add(entity_id)
+    
+    def _index_entity_venue(self, entity: KnowledgeEntity) -> None:
+        """Record which venue event an entity belongs to, replacing any previous entry."""
+        entity_id = entity.entity_id
+        if entity_id in self._entity_venue_keys:
+            old_key = self._entity_venue_keys.pop(entity_id)
+            members = self._venue_event_index[old_key]
+            members.discard(entity_id)
+            if not members:
+                del self._venue_event_index[old_key]
+        
+        if entity.venue_context:
+            key = entity.venue_context.get("event_id")
+            self._entity_venue_keys[entity_id] = key
+            self._venue_event_index[key].add(entity_id)
+    
     async def _is_relevant_to_query(
         self, 
         entity: KnowledgeEntity, 
@@ -346,19 +488,23 @@ class BaseAgent(ABC):
     ) -> bool:
         """Determine if a knowledge entity is relevant to a query."""
         # Simple keyword-based relevance (can be enhanced with embeddings)
-        query_lower = query.lower()
-        content_lower = entity.content.lower()
-        
-        # Check for direct keyword matches
-        query_words = set(query_lower.split())
-        content_words = set(content_lower.split())
+        query_words = self._tokenize(query)
+        content_words = self._entity_token_set(entity)
         
         # Calculate overlap
         overlap = query_words & content_words
         return len(overlap) >= min(3, len(query_words) // 2)
     
-    def _calculate_relevance_score(self, entity: KnowledgeEntity, query: str) -> float:
-        """Calculate relevance score for ranking search results."""
+    def _calculate_relevance_score(
+        self, 
+        entity: KnowledgeEntity, 
+        query: str, 
+        overlap: Optional[int] = None
+    ) -> float:
+        """
+        Calculate relevance score for ranking search results.
+        Pass overlap when the number of shared query words is already known.
+        """
         # Base score from confidence
         base_score = entity.confidence_score
         
@@ -367,9 +513,10 @@ class BaseAgent(ABC):
         recency_boost = max(0, 1 - (days_old / 365))
         
         # Simple keyword matching score
-        query_words = set(query.lower().split())
-        content_words = set(entity.content.lower().split())
-        keyword_score = len(query_words & content_words) / max(len(query_words), 1)
+        query_words = self._tokenize(query)
+        if overlap is None:
+            overlap = len(query_words & self._entity_token_set(entity))
+        keyword_score = overlap / max(len(query_words), 1)
         
         return base_score * (1 + recency_boost * 0.2 + keyword_score * 0.3)
     
@@ -393,15 +540,24 @@ class BaseAgent(ABC):
     
     async def _update_knowledge_relationships(self, entity: KnowledgeEntity) -> None:
         """Update relationships between knowledge entities."""
-        # Find entities that might be related
-        for existing_id, existing_entity in self.knowledge_base.items():
-            if existing_id != entity.entity_id:
-                if await self._are_entities_related(entity, existing_entity):
-                    # Add bidirectional relationship
-                    if existing_id not in entity.relationships:
-                        entity.relationships.append(existing_id)
-                    if entity.entity_id not in existing_entity.relationships:
-                        existing_entity.relationships.append(entity.entity_id)
+        # Only entities sharing a venue event or at least three words can be
+        # related, so candidates come from the indexes rather than a full scan
+        shared_words = Counter()
+        for word in self._entity_token_set(entity):
+            shared_words.update(self._token_index.get(word, ()))
+        candidates = {entity_id for entity_id, count in shared_words.items() if count >= 3}
+        if entity.venue_context:
+            candidates.update(self._venue_event_index.get(entity.venue_context.get("event_id"), ()))
+        candidates.discard(entity.entity_id)
+        
+        for existing_id in sorted(candidates, key=self._entity_order.__getitem__):
+            existing_entity = self.knowledge_base[existing_id]
+            if await self._are_entities_related(entity, existing_entity):
+                # Add bidirectional relationship
+                if existing_id not in entity.relationships:
+                    entity.relationships.append(existing_id)
+                if entity.entity_id not in existing_entity.relationships:
+                    existing_entity.relationships.append(entity.entity_id)
     
     async def _are_entities_related(
         self, 
@@ -415,7 +571,7 @@ class BaseAgent(ABC):
             return True
         
         # Check for content similarity
-        common_words = set(entity1.content.lower().split()) & set(entity2.content.lower().split())
+        common_words = self._entity_token_set(entity1) & self._entity_token_set(entity2)
         return len(common_words) >= 3
     
     def _serialize_knowledge_entity(self, entity: KnowledgeEntity) -> Dict[str, Any]:
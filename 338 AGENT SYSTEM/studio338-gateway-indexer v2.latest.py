@@ -8,9 +8,22 @@ for data parsing, and EventIndex for centralized data storage.
 import re
 import json
 from typing import Dict, List, Any, Optional, Set, Tuple
-from datetime import datetime
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
+from itertools import compress, islice, repeat
+import operator
+import bisect
+import heapq
+import mmap
 import os
+import sys
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used when it is not installed
+    orjson = None
 
 class GatewayChecker:
     """
@@ -18,16 +31,41 @@ class GatewayChecker:
     Uses explicit rules with transparent decision logging.
     """
     
-    def __init__(self, known_events: Dict[str, Dict[str, Any]]):
+    # All supported date formats in one pattern; the named group tells which matched
+    DATE_PATTERN = re.compile(
+        r'(?P<month>\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:st|nd|rd|th)?\b)'
+        r'|(?P<numeric>\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b)'
+        r'|(?P<iso>\b\d{4}-\d{2}-\d{2}\b)',
+        re.IGNORECASE
+    )
+    
+    def __init__(self, known_events: Dict[str, Dict[str, Any]], decision_log_max: int = 10_000):
         """
         Initialize with known events database.
         
         Args:
             known_events: Dictionary of event records with attributes like
                          'name', 'date', 'promoter', keywords, and participants
+            decision_log_max: Most recent categorization decisions kept in memory
         """
         self.known_events = known_events
-        self.decision_log = []
+        self.decision_log = deque(maxlen=decision_log_max)
+        
+        # Lowercased event names, promoters and keywords, matched against
+        # incoming text in a single regex scan instead of per-event checks
+        self._term_events: Dict[str, Set[str]] = defaultdict(set)
+        self._contained_terms: Dict[str, Set[str]] = {}
+        self._event_order: Dict[str, int] = {}
+        self._term_pattern = None
+        
+        # Lowercased promoter first names and team members, and event dates,
+        # mapped to the events they belong to
+        self._person_events: Dict[str, Set[str]] = defaultdict(set)
+        self._event_people: Dict[str, frozenset] = {}
+        self._date_events: Dict[str, Set[str]] = defaultdict(set)
+        for eid in self.known_events:
+            self._register_event(eid)
+        self._compile_term_pattern()
         
     def categorize_whatsapp_group(
         self, 
@@ -41,38 +79,36 @@ class GatewayChecker:
             Tuple of (event_id, reason_for_decision)
         """
         group_name_lower = group_name.lower()
+        matched_terms = self._match_terms(group_name_lower)
         
         # 1. Check group name against known event names and promoter names
-        for eid, event in self.known_events.items():
-            name_kw = event["name"].lower()
-            promoter_kw = event["promoter"].lower() if event.get("promoter") else ""
-            
-            if name_kw in group_name_lower or promoter_kw in group_name_lower:
+        for eid in self._candidate_events(matched_terms):
+            event = self.known_events[eid]
+            if event["_name_lower"] in matched_terms or event["_promoter_lower"] in matched_terms:
                 reason = f"Group name contains '{event['name']}' or promoter '{event['promoter']}'"
                 self._log_decision("whatsapp_group", group_name, eid, reason)
                 return eid, reason
             
             # Check known keywords for the event
-            for kw in event.get("keywords", []):
-                if kw.lower() in group_name_lower:
+            for kw, kw_lower in zip(event.get("keywords", []), event["_keywords_lower"]):
+                if kw_lower in matched_terms:
                     reason = f"Group name contains keyword '{kw}' for event '{event['name']}'"
                     self._log_decision("whatsapp_group", group_name, eid, reason)
                     return eid, reason
         
         # 2. Check if participant names match known promoters or VIPs
         participant_set = {p.lower() for p in participant_names}
-        for eid, event in self.known_events.items():
+        for eid in self._person_candidates(participant_set):
+            event = self.known_events[eid]
             # Check promoter first name
-            if event.get("promoter"):
-                prom_name = event["promoter"].split()[0].lower()
-                if prom_name and prom_name in participant_set:
-                    reason = f"Participant '{prom_name.capitalize()}' is promoter for event '{event['name']}'"
-                    self._log_decision("whatsapp_group", group_name, eid, reason)
-                    return eid, reason
+            prom_name = event["_promoter_first_lower"]
+            if prom_name and prom_name in participant_set:
+                reason = f"Participant '{prom_name.capitalize()}' is promoter for event '{event['name']}'"
+                self._log_decision("whatsapp_group", group_name, eid, reason)
+                return eid, reason
             
             # Check for overlap with known team members
-            known_team = {p.lower() for p in event.get("participants", [])}
-            overlap = participant_set & known_team
+            overlap = participant_set & event["_participants_lower"]
             if overlap:
                 reason = f"Group shares {len(overlap)} members with event '{event['name']}'"
                 self._log_decision("whatsapp_group", group_name, eid, reason)
@@ -82,11 +118,12 @@ class GatewayChecker:
         date = self._find_date(group_name)
         if date:
             # Check if date matches existing event
-            for eid, event in self.known_events.items():
-                if event.get("date") == date:
-                    reason = f"Detected date {date} matching event '{event['name']}'"
-                    self._log_decision("whatsapp_group", group_name, eid, reason)
-                    return eid, reason
+            eid = self._first_event_on(date)
+            if eid is not None:
+                event = self.known_events[eid]
+                reason = f"Detected date {date} matching event '{event['name']}'"
+                self._log_decision("whatsapp_group", group_name, eid, reason)
+                return eid, reason
             
             # Create new event for this date
             new_event_id = self._create_new_event(group_name, date, participant_names)
@@ -113,14 +150,17 @@ class GatewayChecker:
             Tuple of (event_id, reason_for_decision)
         """
         text = (email_subject + " " + email_body).lower()
+        sender_terms = self._match_terms(sender_address.lower())
+        text_terms = self._match_terms(text)
         
         # 1. Check for known promoter brands in sender or content
-        for eid, event in self.known_events.items():
-            if event.get("promoter"):
-                promoter_lower = event["promoter"].lower()
+        for eid in self._candidate_events(sender_terms | text_terms):
+            event = self.known_events[eid]
+            promoter_lower = event["_promoter_lower"]
+            if promoter_lower:
                 
                 # Check sender domain
-                if promoter_lower in sender_address.lower():
+                if promoter_lower in sender_terms:
                     # Try to confirm with date
                     maybe_date = self._find_date(email_subject)
                     if maybe_date and event.get("date") == maybe_date:
@@ -131,13 +171,13 @@ class GatewayChecker:
                     return eid, reason
                 
                 # Check content for promoter name
-                if promoter_lower in text:
+                if promoter_lower in text_terms:
                     reason = f"Email mentions promoter '{event['promoter']}'"
                     self._log_decision("email", email_subject, eid, reason)
                     return eid, reason
             
             # Check for event name in content
-            if event["name"].lower() in text:
+            if event["_name_lower"] in text_terms:
                 reason = f"Email mentions event name '{event['name']}'"
                 self._log_decision("email", email_subject, eid, reason)
                 return eid, reason
@@ -146,11 +186,12 @@ class GatewayChecker:
         date = self._find_date(text)
         if date:
             # Check if any known event has this date
-            for eid, event in self.known_events.items():
-                if event.get("date") == date:
-                    reason = f"Found date {date} in email, matching event '{event['name']}'"
-                    self._log_decision("email", email_subject, eid, reason)
-                    return eid, reason
+            eid = self._first_event_on(date)
+            if eid is not None:
+                event = self.known_events[eid]
+                reason = f"Found date {date} in email, matching event '{event['name']}'"
+                self._log_decision("email", email_subject, eid, reason)
+                return eid, reason
             
             # Create new event for this date
             new_event_id = self._create_new_event(email_subject, date, [])
@@ -168,28 +209,28 @@ class GatewayChecker:
         """
         Parse a date from text using multiple patterns.
         Returns standardized date string or None.
-        """
-        # Pattern 1: Month name and day (e.g., "Oct 15", "October 15th")
-        month_pattern = r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:st|nd|rd|th)?\b'
-        match = re.search(month_pattern, text, re.IGNORECASE)
-        if match:
-            return self._standardize_date(match.group(0))
-        
-        # Pattern 2: DD/MM/YYYY or DD-MM-YYYY
-        date_pattern = r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'
-        match = re.search(date_pattern, text)
-        if match:
-            return self._standardize_date(match.group(0))
-        
-        # Pattern 3: YYYY-MM-DD (ISO format)
-        iso_pattern = r'\b\d{4}-\d{2}-\d{2}\b'
-        match = re.search(iso_pattern, text)
-        if match:
-            return match.group(0)
         
-        return None
+        Formats are preferred in this order regardless of position:
+        month name and day ("Oct 15", "October 15th"), DD/MM/YYYY or
+        DD-MM-YYYY, then YYYY-MM-DD.
+        """
+        numeric = iso = None
+        for match in self.DATE_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == "month":
+                return self._standardize_date(match.group(0))
+            if kind == "numeric":
+                numeric = numeric or match.group(0)
+            else:
+                iso = iso or match.group(0)
+        
+        if numeric:
+            return self._standardize_date(numeric)
+        return iso
     
-    def _standardize_date(self, date_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _standardize_date(date_str: str) -> str:
         """Convert various date formats to YYYY-MM-DD."""
         # This is a simplified version - in production, use dateutil.parser
         # For now, just return the original string
@@ -214,9 +255,107 @@ class GatewayChecker:
             "created_at": datetime.utcnow().isoformat(),
             "source": "auto_detected"
         }
+        self._register_event(new_id)
+        self._compile_term_pattern()
         
         return new_id
     
+    def update_event_participants(self, event_id: str, participants: List[str]) -> None:
+        """Replace an event's known participants, keeping the lookup fields in sync."""
+        event = self.known_events[event_id]
+        event["participants"] = participants
+        self._precompute_participant_fields(event)
+        self._index_event_people(event_id)
+    
+    def _register_event(self, event_id: str) -> None:
+        """Prepare an event's precomputed lookup fields and add it to the term matcher."""
+        self._precompute_name_fields(self.known_events[event_id])
+        self._precompute_participant_fields(self.known_events[event_id])
+        self._index_event_terms(event_id)
+        self._index_event_people(event_id)
+        date = self.known_events[event_id].get("date")
+        if date:
+            self._date_events[date].add(event_id)
+    
+    def _precompute_name_fields(self, event: Dict[str, Any]) -> None:
+        """Store the lowercased name, promoter and keywords used by categorization."""
+        event["_name_lower"] = event["name"].lower()
+        event["_promoter_lower"] = event["promoter"].lower() if event.get("promoter") else ""
+        event["_keywords_lower"] = tuple(kw.lower() for kw in event.get("keywords", []))
+    
+    def _precompute_participant_fields(self, event: Dict[str, Any]) -> None:
+        """Store the lowercased promoter first name and team set used by participant matching."""
+        promoter_parts = event["promoter"].split() if event.get("promoter") else []
+        event["_promoter_first_lower"] = promoter_parts[0].lower() if promoter_parts else ""
+        event["_participants_lower"] = frozenset(p.lower() for p in event.get("participants", []))
+    
+    def _index_event_terms(self, event_id: str) -> None:
+        """Register an event's name, promoter and keywords with the term matcher."""
+        event = self.known_events[event_id]
+        self._event_order.setdefault(event_id, len(self._event_order))
+        
+        for term in (event["_name_lower"], event["_promoter_lower"]) + event["_keywords_lower"]:
+            if not term:
+                continue
+            if term not in self._term_events:
+                # Every term found inside another is implied whenever the longer one matches
+                self._contained_terms[term] = {t for t in self._contained_terms if t in term}
+                self._contained_terms[term].add(term)
+                for other, contained in self._contained_terms.items():
+                    if term in other:
+                        contained.add(term)
+            self._term_events[term].add(event_id)
+    
+    def _index_event_people(self, event_id: str) -> None:
+        """(Re)index an event under its promoter first name and team members."""
+        event = self.known_events[event_id]
+        for name in self._event_people.get(event_id, ()):
+            self._person_events[name].discard(event_id)
+        people = event["_participants_lower"] | {event["_promoter_first_lower"]} - {""}
+        for name in people:
+            self._person_events[name].add(event_id)
+        self._event_people[event_id] = people
+    
+    def _compile_term_pattern(self) -> None:
+        """Compile all known terms into one overlapping-match pattern, longest first."""
+        if not self._term_events:
+            self._term_pattern = None
+            return
+        alternatives = "|".join(
+            re.escape(term) for term in sorted(self._term_events, key=len, reverse=True)
+        )
+        self._term_pattern = re.compile(f"(?=({alternatives}))")
+    
+    def _match_terms(self, text_lower: str) -> Set[str]:
+        """Return every known term that occurs in the (lowercased) text."""
+        if self._term_pattern is None:
+            return set()
+        matched = set()
+        for longest in set(self._term_pattern.findall(text_lower)):
+            matched |= self._contained_terms[longest]
+        return matched
+    
+    def _candidate_events(self, matched_terms: Set[str]) -> List[str]:
+        """Events owning any of the matched terms, in known_events order."""
+        candidates = set()
+        for term in matched_terms:
+            candidates |= self._term_events[term]
+        return sorted(candidates, key=self._event_order.__getitem__)
+    
+    def _person_candidates(self, participant_set: Set[str]) -> List[str]:
+        """Events whose promoter or team includes any participant, in known_events order."""
+        candidates = set()
+        for name in participant_set:
+            candidates |= self._person_events.get(name, set())
+        return sorted(candidates, key=self._event_order.__getitem__)
+    
+    def _first_event_on(self, date: str) -> Optional[str]:
+        """The earliest known event on the given date, or None."""
+        events = self._date_events.get(date)
+        if not events:
+            return None
+        return min(events, key=self._event_order.__getitem__)
+    
     def _log_decision(self, source_type: str, source_name: str, event_id: str, reason: str):
         """Log categorization decision for transparency."""
         self.decision_log.append({
@@ -229,7 +368,7 @@ class GatewayChecker:
     
     def get_decision_log(self) -> List[Dict[str, Any]]:
         """Get the decision log for audit purposes."""
-        return self.decision_log
+        return list(self.decision_log)
 
 
 class LinkParticipantExtractor:
@@ -248,6 +387,15 @@ class LinkParticipantExtractor:
         r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
     )
     
+    # WhatsApp @mention pattern
+    MENTION_PATTERN = re.compile(r'@(\w+)')
+    
+    # First whitespace-delimited word of a name
+    FIRST_WORD_PATTERN = re.compile(r'\S+')
+    
+    # A whole http(s) URL with no whitespace; trailing punctuation is left out of the group
+    URL_CLEAN_PATTERN = re.compile(r'(https?://\S*?)[.,;:!?)]*')
+    
     def extract_from_whatsapp(self, chat_messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Extract structured data from WhatsApp messages.
@@ -260,23 +408,27 @@ class LinkParticipantExtractor:
         """
         extracted_items = []
         
+        # Bound once for the loop; most messages have no links or mentions,
+        # so the regex scans are skipped when their marker is absent
+        find_urls = self.URL_PATTERN.findall
+        clean_url = self._clean_url
+        
         for msg in chat_messages:
             text = msg.get("text", "")
             sender = msg.get("sender", "")
             ts = msg.get("timestamp", "")
             
-            # Extract links from message text
-            links = self.URL_PATTERN.findall(text)
-            
-            # Clean and validate links
-            links = [self._clean_url(link) for link in links]
-            links = [link for link in links if link]  # Remove None values
+            # Extract, clean and validate links in a single pass
+            if "http" in text:
+                links = [link for link in map(clean_url, find_urls(text)) if link]
+            else:
+                links = []
             
             # Extract sender's first name
             first_name = self._extract_first_name(sender)
             
             # Extract any mentioned participants
-            mentions = self._extract_mentions(text)
+            mentions = self._extract_mentions(text) if "@" in text else []
             
             item = {
                 "source": "WhatsApp",
@@ -357,15 +509,14 @@ class LinkParticipantExtractor:
     
     def _clean_url(self, url: str) -> Optional[str]:
         """Clean and validate URL."""
-        # Remove trailing punctuation
-        url = re.sub(r'[.,;:!?)]+, '', url)
-        
-        # Validate URL structure
-        if not url.startswith(('http://', 'https://')):
+        # Validate structure and remove trailing punctuation in one match
+        match = self.URL_CLEAN_PATTERN.fullmatch(url)
+        if not match:
             return None
         
         # Basic validation
-        if len(url) < 10 or ' ' in url:
+        url = match.group(1)
+        if len(url) < 10:
             return None
         
         return url
@@ -377,26 +528,50 @@ class LinkParticipantExtractor:
         
         # Handle "Last, First" format
         if ',' in full_name:
-            parts = full_name.split(',')
-            if len(parts) >= 2:
-                return parts[1].strip().split()[0]
+            full_name = full_name.partition(',')[2].partition(',')[0]
         
         # Standard "First Last" format
-        return full_name.strip().split()[0]
+        match = self.FIRST_WORD_PATTERN.search(full_name)
+        return match.group(0) if match else ""
     
     def _extract_name_from_email(self, email_str: str) -> Optional[str]:
         """Extract name from email string like 'John Doe <john@example.com>'."""
         if '<' in email_str and '>' in email_str:
-            name = email_str.split('<')[0].strip()
+            name = email_str.partition('<')[0].strip()
             return name if name else None
         return None
     
     def _extract_mentions(self, text: str) -> List[str]:
         """Extract @mentions from text."""
-        # WhatsApp mention pattern
-        mention_pattern = r'@(\w+)'
-        mentions = re.findall(mention_pattern, text)
-        return mentions
+        return self.MENTION_PATTERN.findall(text)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON containers used by the index (participant sets, deques)."""
+    if isinstance(obj, (set, frozenset, deque)):
+        return list(obj)
+    return str(obj)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode()
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_load_file(path: str) -> Any:
+    """Parse a JSON file; with orjson the file is memory-mapped and parsed in place."""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
 
 
 class EventIndex:
@@ -405,21 +580,81 @@ class EventIndex:
     Maintains categorized data organized by event/promoter with chronological ordering.
     """
     
-    def __init__(self, storage_path: Optional[str] = None):
+    # Equipment keywords to track
+    EQUIPMENT_KEYWORDS = [
+        "mixer", "CDJ", "speaker", "light", "laser", "stage",
+        "generator", "cable", "microphone", "amplifier"
+    ]
+    
+    # One scan of the lowercased content for all keywords. Matches must start at
+    # a word boundary, so "lights" and "mixers" count but "flight" does not.
+    # Lowercasing once and matching case-sensitively is about twice as fast
+    # as an IGNORECASE scan, which case-folds every character it compares.
+    EQUIPMENT_PATTERN = re.compile(
+        r'\b(' + '|'.join(re.escape(kw.lower()) for kw in EQUIPMENT_KEYWORDS) + r')'
+    )
+    _EQUIPMENT_BY_LOWER = {kw.lower(): kw for kw in EQUIPMENT_KEYWORDS}
+    
+    def __init__(
+        self, 
+        storage_path: Optional[str] = None, 
+        max_communications: int = 10_000,
+        compact_every: int = 1000,
+        flush_every: int = 50
+    ):
         """
         Initialize event index.
         
         Args:
             storage_path: Path to persistent storage (JSON file)
+            max_communications: Most recent communications kept per event
+            compact_every: Logged operations between full snapshot rewrites
+            flush_every: Logged operations buffered before the log is flushed
         """
         self.events: Dict[str, Dict[str, Any]] = {}
         self.storage_path = storage_path or "/Volumes/Studio338Data/event_index.json"
+        self.max_communications = max_communications
+        self.compact_every = compact_every
+        self.flush_every = flush_every
+        
+        # Parsed epoch seconds of each event's communications, kept in step with
+        # the communications deque. They are the sort key, so insert positions
+        # and time-window cutoffs are bisected directly; unparseable timestamps
+        # are -inf and stay at the front, outside every window
+        self._ts_epochs: Dict[str, deque] = {}
+        # Each communication's source in the same order, so source filters
+        # compare a flat column instead of reading every item dict
+        self._sources: Dict[str, deque] = {}
+        # Number of retained communications per source, per event
+        self._source_counts: Dict[str, Counter] = {}
+        
+        # Running totals for get_statistics: every participant name across
+        # events, and links in the retained communications
+        self._all_participants: Set[str] = set()
+        self._total_links = 0
+        
+        # Reverse index of lowercased participant first names to event IDs
+        self._participant_to_events: Dict[str, Set[str]] = defaultdict(set)
+        
+        # Trigrams of lowercased event names, promoters and participants, so
+        # substring searches only verify events that contain every query trigram
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._event_order: Dict[str, int] = {}
+        
         self.index_stats = {
             "total_events": 0,
             "total_communications": 0,
             "last_updated": None
         }
         
+        # Mutations are appended to a JSONL operation log next to the snapshot;
+        # the snapshot is only rewritten when the log is compacted
+        self._log_path = self.storage_path + ".log"
+        self._log_file = None
+        self._log_seq = 0
+        self._ops_since_compact = 0
+        self._ops_since_flush = 0
+        
         # Load existing data if available
         self._load_from_storage()
     
@@ -432,65 +667,74 @@ class EventIndex:
     ) -> None:
         """Initialize a new event category in the index if not exists."""
         if event_id not in self.events:
-            self.events[event_id] = {
-                "event_name": name,
-                "date": date,
-                "promoter": promoter,
-                "participants": set(),
-                "communications": [],
-                "equipment_mentions": defaultdict(int),
-                "created_at": datetime.utcnow().isoformat(),
-                "last_activity": datetime.utcnow().isoformat()
-            }
-            self.index_stats["total_events"] += 1
-            self._save_to_storage()
+            now = datetime.utcnow().isoformat()
+            self._apply_add_event(event_id, name, date, promoter, now)
+            self._log_operation({
+                "op": "add_event", "event_id": event_id, "name": name,
+                "date": date, "promoter": promoter, "ts": now
+            })
     
     def update_participants(self, event_id: str, first_names: List[str]) -> None:
         """Add participant first names to the event record."""
         if event_id in self.events:
-            self.events[event_id]["participants"].update(first_names)
-            self.events[event_id]["last_activity"] = datetime.utcnow().isoformat()
-            self._save_to_storage()
+            now = datetime.utcnow().isoformat()
+            self._apply_update_participants(event_id, first_names, now)
+            self._log_operation({
+                "op": "update_participants", "event_id": event_id,
+                "first_names": list(first_names), "ts": now
+            })
     
-    def add_communication(self, event_id: str, item: Dict[str, Any]) -> None:
+    def add_communication(
+        self, 
+        event_id: str, 
+        item: Dict[str, Any], 
+        now: Optional[str] = None
+    ) -> None:
         """
         Add a communication item (from WhatsApp or Email) to the event's record.
         
         Args:
             event_id: Event identifier
             item: Communication data dict with at least 'timestamp' and 'source'
+            now: ISO time of ingest; bulk loaders can pass one value for a whole batch
         """
-        # Ensure event exists
-        if event_id not in self.events:
-            self.add_event(event_id, name=event_id)
+        now = now or datetime.utcnow().isoformat()
         
         # Add timestamp if missing
         if not item.get("timestamp"):
-            item["timestamp"] = datetime.utcnow().isoformat()
-        
-        # Append the communication item
-        self.events[event_id]["communications"].append(item)
-        
-        # Keep communications sorted by timestamp
-        self.events[event_id]["communications"].sort(
-            key=lambda x: x.get("timestamp", "")
-        )
-        
-        # Update participants
-        if item.get("first_name"):
-            self.update_participants(event_id, [item["first_name"]])
-        if item.get("first_names"):
-            self.update_participants(event_id, item["first_names"])
-        
-        # Track equipment mentions
-        self._update_equipment_mentions(event_id, item)
-        
-        # Update stats
-        self.events[event_id]["last_activity"] = datetime.utcnow().isoformat()
-        self.index_stats["total_communications"] += 1
-        self.index_stats["last_updated"] = datetime.utcnow().isoformat()
+            item["timestamp"] = now
         
+        self._apply_add_communication(event_id, item, now)
+        self._log_operation({
+            "op": "add_communication", "event_id": event_id, "item": item, "ts": now
+        })
+    
+    def get_participant_events(self, first_name: str) -> List[str]:
+        """Get the IDs of events a participant (by first name) has appeared in."""
+        return list(self._participant_to_events.get(first_name.lower(), ()))
+    
+    def flush(self) -> None:
+        """Flush buffered operation log writes to disk."""
+        if self._log_file is not None:
+            self._log_file.flush()
+        self._ops_since_flush = 0
+    
+    def compact(self) -> None:
+        """Write a full snapshot of the index and truncate the operation log."""
+        if not self.storage_path:
+            return
         self._save_to_storage()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        self._ops_since_flush = 0
+        if os.path.exists(self._log_path):
+            open(self._log_path, 'w').close()
+        self._ops_since_compact = 0
+    
+    def close(self) -> None:
+        """Compact pending operations into the snapshot and release the log file."""
+        self.compact()
     
     def get_event_communications(
         self, 
@@ -513,21 +757,30 @@ class EventIndex:
             return []
         
         communications = self.events[event_id]["communications"]
+        sources = self._sources[event_id]
         
-        # Apply time window filter
+        # Apply time window filter. Communications are in timestamp order, so
+        # the window is a suffix found by bisecting the cutoff
         if time_window:
-            cutoff = self._calculate_cutoff_time(time_window)
-            communications = [
-                comm for comm in communications
-                if datetime.fromisoformat(comm["timestamp"]) > cutoff
-            ]
+            cutoff_epoch = self._calculate_cutoff_time(time_window).timestamp()
+            ts_epochs = self._ts_epochs[event_id]
+            in_window = len(ts_epochs) - bisect.bisect_right(ts_epochs, cutoff_epoch)
+        else:
+            in_window = len(communications)
         
-        # Apply source filter
+        # Apply source filter against the source column; both columns are read
+        # from the right-hand end of their deques and the result is reversed
         if source_filter:
-            communications = [
-                comm for comm in communications
-                if comm.get("source") == source_filter
-            ]
+            if not self._source_counts[event_id][source_filter]:
+                return []
+            matches = map(operator.eq, islice(reversed(sources), in_window), repeat(source_filter))
+            communications = list(compress(islice(reversed(communications), in_window), matches))
+            communications.reverse()
+        elif in_window < len(communications):
+            communications = list(islice(reversed(communications), in_window))
+            communications.reverse()
+        else:
+            communications = list(communications)
         
         return communications
     
@@ -540,22 +793,21 @@ class EventIndex:
         communications = event["communications"]
         
         # Calculate summary statistics
-        whatsapp_count = sum(1 for c in communications if c.get("source") == "WhatsApp")
-        email_count = sum(1 for c in communications if c.get("source") == "Email")
+        source_counts = self._source_counts[event_id]
+        whatsapp_count = source_counts["WhatsApp"]
+        email_count = source_counts["Email"]
         
         # Get recent activity
-        recent_cutoff = self._calculate_cutoff_time("24h")
-        recent_comms = [
-            c for c in communications
-            if datetime.fromisoformat(c["timestamp"]) > recent_cutoff
-        ]
+        recent_cutoff = self._calculate_cutoff_time("24h").timestamp()
+        ts_epochs = self._ts_epochs[event_id]
+        recent_count = len(ts_epochs) - bisect.bisect_right(ts_epochs, recent_cutoff)
         
         # Top equipment mentions
-        top_equipment = sorted(
+        top_equipment = heapq.nlargest(
+            5,
             event["equipment_mentions"].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+            key=lambda x: x[1]
+        )
         
         return {
             "event_id": event_id,
@@ -566,7 +818,7 @@ class EventIndex:
             "whatsapp_messages": whatsapp_count,
             "email_messages": email_count,
             "unique_participants": len(event["participants"]),
-            "recent_activity_24h": len(recent_comms),
+            "recent_activity_24h": recent_count,
             "top_equipment_mentions": top_equipment,
             "created_at": event["created_at"],
             "last_activity": event["last_activity"]
@@ -586,7 +838,20 @@ class EventIndex:
         query_lower = query.lower()
         matching_events = []
         
-        for event_id, event in self.events.items():
+        if len(query_lower) >= 3:
+            postings = sorted(
+                (self._trigram_index.get(gram, set()) for gram in self._trigrams(query_lower)),
+                key=len
+            )
+            candidates = postings[0].intersection(*postings[1:])
+            candidate_ids = sorted(candidates, key=self._event_order.__getitem__)
+        else:
+            # Queries shorter than a trigram have to check every event
+            candidate_ids = list(self.events)
+        
+        for event_id in candidate_ids:
+            event = self.events[event_id]
+            
             # Check event name
             if query_lower in event["event_name"].lower():
                 matching_events.append(event_id)
@@ -617,19 +882,11 @@ class EventIndex:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get overall index statistics."""
-        total_participants = set()
-        total_links = 0
-        
-        for event in self.events.values():
-            total_participants.update(event["participants"])
-            for comm in event["communications"]:
-                total_links += len(comm.get("links", []))
-        
         return {
             "total_events": len(self.events),
             "total_communications": self.index_stats["total_communications"],
-            "unique_participants": len(total_participants),
-            "total_links_shared": total_links,
+            "unique_participants": len(self._all_participants),
+            "total_links_shared": self._total_links,
             "last_updated": self.index_stats["last_updated"]
         }
     
@@ -645,33 +902,205 @@ class EventIndex:
         """
         filepath = filepath or f"/Volumes/Studio338Data/event_index_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        # Convert sets to lists for JSON serialization
-        export_data = {}
-        for eid, info in self.events.items():
-            export_data[eid] = {
-                "event_name": info["event_name"],
-                "date": info["date"],
-                "promoter": info["promoter"],
-                "participants": list(info["participants"]),
-                "communications": info["communications"],
-                "equipment_mentions": dict(info["equipment_mentions"]),
-                "created_at": info["created_at"],
-                "last_activity": info["last_activity"]
-            }
-        
-        with open(filepath, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        # Stream one event at a time so only a single event's serialized copy is
+        # held in memory. Each event is dumped as a one-key object and its outer
+        # braces are stripped, so the file matches a single indented dump.
+        with open(filepath, 'wb') as f:
+            f.write(b"{")
+            separator = b"\n"
+            for eid, info in self.events.items():
+                chunk = _json_dumps({eid: self._event_record(info)}, indent=True)
+                f.write(separator + chunk[2:-2])
+                separator = b",\n"
+            f.write(b"\n}" if separator == b",\n" else b"}")
         
         return filepath
     
+    @staticmethod
+    def _event_record(info: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an in-memory event to its JSON form (sets, deques and defaultdicts to plain types)."""
+        return {
+            "event_name": info["event_name"],
+            "date": info["date"],
+            "promoter": info["promoter"],
+            "participants": list(info["participants"]),
+            "communications": list(info["communications"]),
+            "equipment_mentions": dict(info["equipment_mentions"]),
+            "created_at": info["created_at"],
+            "last_activity": info["last_activity"]
+        }
+    
+    def _apply_add_event(
+        self, 
+        event_id: str, 
+        name: str, 
+        date: Optional[str], 
+        promoter: Optional[str],
+        now: str
+    ) -> None:
+        """Create the in-memory event record."""
+        self.events[event_id] = {
+            "event_name": name,
+            "date": date,
+            "promoter": promoter,
+            "participants": set(),
+            "communications": deque(maxlen=self.max_communications),
+            "equipment_mentions": defaultdict(int),
+            "created_at": now,
+            "last_activity": now
+        }
+        self._ts_epochs[event_id] = deque(maxlen=self.max_communications)
+        self._sources[event_id] = deque(maxlen=self.max_communications)
+        self._source_counts[event_id] = Counter()
+        self._index_event_search_terms(event_id)
+        self.index_stats["total_events"] += 1
+    
+    def _apply_update_participants(self, event_id: str, first_names: List[str], now: str) -> None:
+        """Merge participant first names into the in-memory event record."""
+        self.events[event_id]["participants"].update(first_names)
+        self.events[event_id]["last_activity"] = now
+        self._all_participants.update(first_names)
+        for first_name in first_names:
+            self._participant_to_events[first_name.lower()].add(event_id)
+            self._index_search_text(event_id, first_name)
+    
+    def _apply_add_communication(self, event_id: str, item: Dict[str, Any], now: str) -> None:
+        """Insert a communication item and update the derived event state."""
+        # Ensure event exists
+        if event_id not in self.events:
+            self._apply_add_event(event_id, event_id, None, None, now)
+        
+        self._intern_fields(item)
+        
+        # Keep communications sorted by parsed time; once the buffer is full the
+        # oldest item is evicted to make room
+        communications = self.events[event_id]["communications"]
+        ts_epochs = self._ts_epochs[event_id]
+        sources = self._sources[event_id]
+        source_counts = self._source_counts[event_id]
+        epoch = self._timestamp_epoch(item["timestamp"])
+        if not ts_epochs or ts_epochs[-1] <= epoch:
+            idx = len(ts_epochs)
+        elif len(ts_epochs) < ts_epochs.maxlen or ts_epochs[0] <= epoch:
+            idx = bisect.bisect_right(ts_epochs, epoch)
+        else:
+            # Older than everything retained in a full buffer
+            idx = None
+        
+        if idx is not None:
+            if len(ts_epochs) == ts_epochs.maxlen:
+                evicted = communications.popleft()
+                ts_epochs.popleft()
+                sources.popleft()
+                source_counts[evicted.get("source")] -= 1
+                self._total_links -= len(evicted.get("links", []))
+                idx -= 1
+            communications.insert(idx, item)
+            ts_epochs.insert(idx, epoch)
+            sources.insert(idx, item.get("source"))
+            source_counts[item.get("source")] += 1
+            self._total_links += len(item.get("links", []))
+        
+        # Update participants
+        if item.get("first_name"):
+            self._apply_update_participants(event_id, [item["first_name"]], now)
+        if item.get("first_names"):
+            self._apply_update_participants(event_id, item["first_names"], now)
+        
+        # Track equipment mentions
+        self._update_equipment_mentions(event_id, item)
+        
+        # Update stats
+        self.events[event_id]["last_activity"] = now
+        self.index_stats["total_communications"] += 1
+        self.index_stats["last_updated"] = now
+    
+    @staticmethod
+    def _timestamp_epoch(ts: str) -> float:
+        """
+        Parse an ISO or RFC 2822 (email header) timestamp to epoch seconds, or
+        -inf if it cannot be parsed. Timestamps without an offset are UTC.
+        """
+        try:
+            parsed = datetime.fromisoformat(ts)
+        except (TypeError, ValueError):
+            try:
+                parsed = parsedate_to_datetime(ts)
+            except (TypeError, ValueError, IndexError):
+                return float("-inf")
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """All three-character substrings of text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _index_search_text(self, event_id: str, text: str) -> None:
+        """Add one searchable field value to the trigram index."""
+        for gram in self._trigrams(text.lower()):
+            self._trigram_index[gram].add(event_id)
+    
+    def _index_event_search_terms(self, event_id: str) -> None:
+        """Index an event's name, promoter and current participants for search_events."""
+        event = self.events[event_id]
+        self._event_order.setdefault(event_id, len(self._event_order))
+        self._index_search_text(event_id, event["event_name"])
+        if event["promoter"]:
+            self._index_search_text(event_id, event["promoter"])
+        for participant in event["participants"]:
+            self._index_search_text(event_id, participant)
+    
+    def _replay_operation(self, op: Dict[str, Any]) -> None:
+        """Re-apply one logged operation to the in-memory index."""
+        kind = op["op"]
+        event_id = op["event_id"]
+        if kind == "add_event":
+            if event_id not in self.events:
+                self._apply_add_event(event_id, op["name"], op["date"], op["promoter"], op["ts"])
+        elif kind == "update_participants":
+            if event_id in self.events:
+                self._apply_update_participants(event_id, op["first_names"], op["ts"])
+        elif kind == "add_communication":
+            self._apply_add_communication(event_id, op["item"], op["ts"])
+    
+    def _log_operation(self, op: Dict[str, Any]) -> None:
+        """Append an operation to the log, compacting once enough have accumulated."""
+        if not self.storage_path:
+            return
+        
+        self._log_seq += 1
+        op["seq"] = self._log_seq
+        
+        if self._log_file is None:
+            directory = os.path.dirname(self._log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._log_file = open(self._log_path, 'ab')
+        self._log_file.write(_json_dumps(op) + b"\n")
+        
+        self._ops_since_compact += 1
+        self._ops_since_flush += 1
+        if self._ops_since_compact >= self.compact_every:
+            self.compact()
+        elif self._ops_since_flush >= self.flush_every:
+            self.flush()
+    
+    # Fields repeated across many communications; interning shares one string
+    # object per distinct value and makes equality checks identity checks
+    _INTERNED_FIELDS = ("source", "sender", "from", "group_id", "thread_id")
+    
+    @classmethod
+    def _intern_fields(cls, item: Dict[str, Any]) -> None:
+        """Intern the repeated string fields of a communication item in place."""
+        for field in cls._INTERNED_FIELDS:
+            value = item.get(field)
+            if type(value) is str:
+                item[field] = sys.intern(value)
+    
     def _update_equipment_mentions(self, event_id: str, item: Dict[str, Any]) -> None:
         """Track equipment mentions in communications."""
-        # Equipment keywords to track
-        equipment_keywords = [
-            "mixer", "CDJ", "speaker", "light", "laser", "stage",
-            "generator", "cable", "microphone", "amplifier"
-        ]
-        
         # Check message content
         content = ""
         if item.get("source") == "WhatsApp":
@@ -679,15 +1108,15 @@ class EventIndex:
         elif item.get("source") == "Email":
             content = f"{item.get('subject', '')} {item.get('body', '')}"
         
-        content_lower = content.lower()
-        
-        for equipment in equipment_keywords:
-            if equipment in content_lower:
-                self.events[event_id]["equipment_mentions"][equipment] += 1
+        # A message counts once per keyword, however often it repeats it
+        mentions = self.events[event_id]["equipment_mentions"]
+        for kw_lower in set(self.EQUIPMENT_PATTERN.findall(content.lower())):
+            mentions[self._EQUIPMENT_BY_LOWER[kw_lower]] += 1
     
     def _calculate_cutoff_time(self, time_window: str) -> datetime:
         """Calculate cutoff datetime from time window string."""
-        now = datetime.utcnow()
+        # Aware UTC, to compare with communication epochs (naive timestamps are UTC)
+        now = datetime.now(timezone.utc)
         
         if time_window.endswith('h'):
             hours = int(time_window[:-1])
@@ -705,37 +1134,42 @@ class EventIndex:
             return
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
+        directory = os.path.dirname(self.storage_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
-        # Prepare data for JSON serialization
+        # Prepare data for JSON serialization; log_seq records the last
+        # operation already folded into this snapshot
         save_data = {
             "events": {},
-            "stats": self.index_stats
+            "stats": self.index_stats,
+            "log_seq": self._log_seq
         }
         
         for eid, info in self.events.items():
-            save_data["events"][eid] = {
-                "event_name": info["event_name"],
-                "date": info["date"],
-                "promoter": info["promoter"],
-                "participants": list(info["participants"]),
-                "communications": info["communications"],
-                "equipment_mentions": dict(info["equipment_mentions"]),
-                "created_at": info["created_at"],
-                "last_activity": info["last_activity"]
-            }
-        
-        with open(self.storage_path, 'w') as f:
-            json.dump(save_data, f, indent=2, default=str)
+            save_data["events"][eid] = self._event_record(info)
+        
+        # Write to a temporary file first so a crash never leaves a torn snapshot.
+        # The snapshot is compact: indenting forces the stdlib encoder onto its
+        # pure-Python path, and export_to_json is there for readable output.
+        tmp_path = self.storage_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(save_data))
+        os.replace(tmp_path, self.storage_path)
     
     def _load_from_storage(self) -> None:
-        """Load index from persistent storage."""
-        if not self.storage_path or not os.path.exists(self.storage_path):
+        """Load index from persistent storage, then replay the operation log."""
+        if not self.storage_path:
             return
-        
+        if os.path.exists(self.storage_path):
+            self._load_snapshot()
+        if os.path.exists(self._log_path):
+            self._replay_log()
+    
+    def _load_snapshot(self) -> None:
+        """Load the last full snapshot of the index."""
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
+            data = _json_load_file(self.storage_path)
             
             # Restore events
             for eid, info in data.get("events", {}).items():
@@ -744,7 +1178,7 @@ class EventIndex:
                     "date": info["date"],
                     "promoter": info["promoter"],
                     "participants": set(info["participants"]),
-                    "communications": info["communications"],
+                    "communications": deque(info["communications"], maxlen=self.max_communications),
                     "equipment_mentions": defaultdict(int, info.get("equipment_mentions", {})),
                     "created_at": info["created_at"],
                     "last_activity": info["last_activity"]
@@ -752,6 +1186,52 @@ class EventIndex:
             
             # Restore stats
             self.index_stats = data.get("stats", self.index_stats)
+            self._log_seq = data.get("log_seq", 0)
             
+            for eid, info in self.events.items():
+                for comm in info["communications"]:
+                    self._intern_fields(comm)
+                self._index_event_search_terms(eid)
+                # Older snapshots were ordered by timestamp string; a stable sort
+                # on the parsed time restores the order the time windows rely on
+                epochs = [self._timestamp_epoch(c.get("timestamp", "")) for c in info["communications"]]
+                order = sorted(range(len(epochs)), key=epochs.__getitem__)
+                info["communications"] = deque(
+                    (info["communications"][i] for i in order),
+                    maxlen=self.max_communications
+                )
+                self._ts_epochs[eid] = deque(
+                    (epochs[i] for i in order),
+                    maxlen=self.max_communications
+                )
+                self._sources[eid] = deque(
+                    (c.get("source") for c in info["communications"]),
+                    maxlen=self.max_communications
+                )
+                self._source_counts[eid] = Counter(self._sources[eid])
+                self._total_links += sum(len(c.get("links", [])) for c in info["communications"])
+                self._all_participants.update(info["participants"])
+                for first_name in info["participants"]:
+                    self._participant_to_events[first_name.lower()].add(eid)
+            
+        except Exception as e:
+            print(f"Error loading index from storage: {e}")
+    
+    def _replay_log(self) -> None:
+        """Apply logged operations newer than the snapshot."""
+        snapshot_seq = self._log_seq
+        try:
+            with open(self._log_path, 'rb') as f:
+                for line in f:
+                    try:
+                        op = _json_loads(line)
+                    except ValueError:
+                        # A partially written last line from an interrupted append
+                        break
+                    if op.get("seq", 0) <= snapshot_seq:
+                        continue
+                    self._replay_operation(op)
+                    self._log_seq = op["seq"]
+                    self._ops_since_compact += 1
         except Exception as e:
-            print(f"Error loading index from storage: {e}")
\ No newline at end of file
+            print(f"Error replaying index operation log: {e}")
\ No newline at end of file
@@ -10,14 +10,24 @@ import os
 import sys
 import subprocess
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import pygit2
+except ImportError:  # optional; the git command line is used when it is not installed
+    pygit2 = None
+
 # Repository configuration
 REPO_NAME = "studio338-ai-intelligence"
 REPO_DESCRIPTION = "Advanced multi-agent system for Studio338 venue operations using A2A+MCP protocols"
 GITHUB_USERNAME = os.getenv("GITHUB_USERNAME", "your-username")
 
+# Records which PROJECT_STRUCTURE a project directory was last built from
+SETUP_CACHE_FILE = ".setup_cache.json"
+
 # Project structure
 PROJECT_STRUCTURE = {
     "agents": {
@@ -76,8 +86,23 @@ PROJECT_STRUCTURE = {
     }
 }
 
-def create_directory_structure(base_path: Path, structure: dict, level=0):
-    """Recursively create directory structure with files."""
+def _stub_content(filename: str, package_name: str):
+    """Return the placeholder content for a generated file, or None to leave it empty."""
+    if filename.endswith('.py') and filename != "__init__.py":
+        return f'"""\n{filename} - Part of Studio338 AI Intelligence System\n"""\n\n# TODO: Implement this module\n'
+    if filename == "__init__.py":
+        return f'"""Package initialization for {package_name}"""\n'
+    return None
+
+def _write_stub(path: Path, content):
+    """Write a placeholder file, or just create it when it has no content."""
+    if content is None:
+        path.touch(exist_ok=True)
+    else:
+        path.write_text(content)
+
+def _walk_structure(base_path: Path, structure: dict, level: int, directories: dict, stubs: list):
+    """Flatten a structure into its directories (parents first) and file stubs, printing progress."""
     indent = "  " * level
     
     for name, content in structure.items():
@@ -86,47 +111,66 @@ def create_directory_structure(base_path: Path, structure: dict, level=0):
         if content is None:
             # It's a file
             print(f"{indent}📄 Creating file: {name}")
-            path.touch(exist_ok=True)
-            
-            # Add basic content to Python files
-            if name.endswith('.py') and name != "__init__.py":
-                with open(path, 'w') as f:
-                    f.write(f'"""\n{name} - Part of Studio338 AI Intelligence System\n"""\n\n')
-                    f.write('# TODO: Implement this module\n')
-            elif name == "__init__.py":
-                with open(path, 'w') as f:
-                    f.write(f'"""Package initialization for {base_path.name}"""\n')
+            stubs.append((path, _stub_content(name, base_path.name)))
                     
         elif isinstance(content, list):
             # It's a directory with a list of files
             print(f"{indent}📁 Creating directory: {name}/")
-            path.mkdir(exist_ok=True)
+            directories[path] = None
             for filename in content:
                 file_path = path / filename
                 print(f"{indent}  📄 Creating file: {filename}")
-                file_path.touch(exist_ok=True)
-                
-                if filename.endswith('.py') and filename != "__init__.py":
-                    with open(file_path, 'w') as f:
-                        f.write(f'"""\n{filename} - Part of Studio338 AI Intelligence System\n"""\n\n')
-                        f.write('# TODO: Implement this module\n')
-                elif filename == "__init__.py":
-                    with open(file_path, 'w') as f:
-                        f.write(f'"""Package initialization for {name}"""\n')
+                stubs.append((file_path, _stub_content(filename, name)))
                         
         elif isinstance(content, dict):
             # It's a directory with subdirectories
             print(f"{indent}📁 Creating directory: {name}/")
-            path.mkdir(exist_ok=True)
-            create_directory_structure(path, content, level + 1)
+            directories[path] = None
+            _walk_structure(path, content, level + 1, directories, stubs)
 
-def create_requirements_file(base_path: Path):
-    """Create requirements.txt with necessary dependencies."""
-    requirements = """# Core dependencies
+def create_directory_structure(base_path: Path, structure: dict, level=0):
+    """
+    Create directory structure with files.
+    
+    The structure is flattened once into unique directories and file stubs.
+    Each directory is created exactly once, parents first, then the stubs are
+    written together on a thread pool, as each is an independent
+    syscall-bound write.
+    
+    A hash of the structure is recorded in base_path; when it is unchanged on
+    a later run the walk is skipped and existing files are left untouched.
+    Delete the cache file to force a rebuild.
+    """
+    cache_file = base_path / SETUP_CACHE_FILE
+    key = hashlib.blake2b(repr(structure).encode(), digest_size=16).hexdigest()
+    try:
+        if json.loads(cache_file.read_text()).get("key") == key:
+            print(f"{'  ' * level}✅ Directory structure unchanged, skipping")
+            return
+    except (OSError, ValueError):
+        pass
+    
+    directories = {}  # insertion-ordered set
+    stubs = []
+    _walk_structure(base_path, structure, level, directories, stubs)
+    
+    for directory in directories:
+        directory.mkdir(exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        # list() so any write error is raised here
+        list(executor.map(lambda stub: _write_stub(*stub), stubs))
+    
+    cache_file.write_text(json.dumps({"key": key, "timestamp": datetime.now().isoformat()}))
+
+_REQUIREMENTS_TEXT = """# Core dependencies
 fastapi==0.104.1
 uvicorn[standard]==0.24.0
-pydantic==2.5.0
+pydantic==2.10.3
+pydantic-settings==2.7.0
 python-dotenv==1.0.0
+orjson==3.9.10
+ijson==3.2.3
 
 # AI/ML dependencies
 spacy==3.7.2
@@ -168,14 +212,13 @@ flake8==6.1.0
 mypy==1.7.1
 pre-commit==3.5.0
 """
-    
-    with open(base_path / "requirements.txt", 'w') as f:
-        f.write(requirements)
+
+def create_requirements_file(base_path: Path):
+    """Create requirements.txt with necessary dependencies."""
+    (base_path / "requirements.txt").write_text(_REQUIREMENTS_TEXT)
     print("✅ Created requirements.txt")
 
-def create_env_example(base_path: Path):
-    """Create .env.example file with configuration template."""
-    env_example = """# Studio338 AI Intelligence Configuration
+_ENV_EXAMPLE_TEXT = """# Studio338 AI Intelligence Configuration
 
 # Agent Configuration
 ELA_AGENT_ID=ela-studio338-001
@@ -226,14 +269,13 @@ VENUE_NAME=Studio338
 KEY_PERSONNEL=Alice Johnson,Bob Smith,Charlie Brown
 EQUIPMENT_CATEGORIES=audio,lighting,staging,power,safety
 """
-    
-    with open(base_path / ".env.example", 'w') as f:
-        f.write(env_example)
+
+def create_env_example(base_path: Path):
+    """Create .env.example file with configuration template."""
+    (base_path / ".env.example").write_text(_ENV_EXAMPLE_TEXT)
     print("✅ Created .env.example")
 
-def create_gitignore(base_path: Path):
-    """Create .gitignore file."""
-    gitignore = """# Python
+_GITIGNORE_TEXT = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -290,20 +332,20 @@ docs/_build/
 *.tmp
 *.temp
 .cache/
+.setup_cache.json
 
 # Security
 *.pem
 *.key
 secrets/
 """
-    
-    with open(base_path / ".gitignore", 'w') as f:
-        f.write(gitignore)
+
+def create_gitignore(base_path: Path):
+    """Create .gitignore file."""
+    (base_path / ".gitignore").write_text(_GITIGNORE_TEXT)
     print("✅ Created .gitignore")
 
-def create_docker_compose(base_path: Path):
-    """Create docker-compose.yml for local development."""
-    docker_compose = """version: '3.8'
+_DOCKER_COMPOSE_TEXT = """version: '3.8'
 
 services:
   # Main API service
@@ -394,32 +436,38 @@ services:
 volumes:
   postgres_data:
 """
-    
+
+def create_docker_compose(base_path: Path):
+    """Create docker-compose.yml for local development."""
     deployment_dir = base_path / "deployment" / "docker"
     deployment_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(base_path / "docker-compose.yml", 'w') as f:
-        f.write(docker_compose)
+    (base_path / "docker-compose.yml").write_text(_DOCKER_COMPOSE_TEXT)
     print("✅ Created docker-compose.yml")
 
-def create_main_app(base_path: Path):
-    """Create main FastAPI application file."""
-    main_py = '''"""
+_MAIN_PY_TEXT = '''"""
 Main FastAPI application for Studio338 AI Intelligence System
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
+import gc
 import logging
+import os
+import signal
+import socket
 from contextlib import asynccontextmanager
 
-from app.config import settings
+from app.config import get_settings
 from app.routers import agents, health
 from app.routers.studio338 import emails, whatsapp, events, operations
 from app.services.agent_orchestrator import AgentOrchestrator
 
+settings = get_settings()
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
@@ -427,31 +475,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global agent orchestrator instance
-orchestrator = None
+async def start_orchestrator(app: FastAPI):
+    """Initialize the agent orchestrator and start its agents, models included."""
+    try:
+        orchestrator = AgentOrchestrator(settings)
+        await orchestrator.initialize()
+        await orchestrator.start_all_agents()
+        app.state.orchestrator = orchestrator
+        logger.info("System initialized successfully")
+    except Exception:
+        logger.exception("Agent orchestrator failed to start")
+    finally:
+        app.state.orchestrator_ready.set()
+
+async def get_orchestrator(request: Request) -> AgentOrchestrator:
+    """
+    Dependency for agent endpoints; waits for the background startup to finish.
+    Tests can replace it through app.dependency_overrides without running lifespan.
+    """
+    state = request.app.state
+    await state.orchestrator_ready.wait()
+    if state.orchestrator is None:
+        raise HTTPException(status_code=503, detail="Agents are unavailable")
+    return state.orchestrator
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown."""
-    global orchestrator
-    
     # Startup
     logger.info("Starting Studio338 AI Intelligence System...")
     
-    # Initialize agent orchestrator
-    orchestrator = AgentOrchestrator(settings)
-    await orchestrator.initialize()
-    
-    # Start agents
-    await orchestrator.start_all_agents()
-    
-    logger.info("System initialized successfully")
+    # The orchestrator lives on app.state, set once its agents have started.
+    # Agents and their models load in the background, so the server binds and
+    # answers /health straight away; agent endpoints wait via get_orchestrator
+    app.state.orchestrator = None
+    app.state.orchestrator_ready = asyncio.Event()
+    startup = asyncio.create_task(start_orchestrator(app))
     
     yield
     
     # Shutdown
     logger.info("Shutting down Studio338 AI Intelligence System...")
-    await orchestrator.shutdown()
+    await startup
+    if app.state.orchestrator is not None:
+        await app.state.orchestrator.shutdown()
     logger.info("System shutdown complete")
 
 # Create FastAPI app
@@ -480,12 +547,13 @@ app.include_router(events.router, prefix="/api/v1/studio338/events", tags=["stud
 app.include_router(operations.router, prefix="/api/v1/studio338/operations", tags=["studio338-operations"])
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint with system information."""
+    orchestrator = getattr(request.app.state, "orchestrator", None)
     return {
         "name": "Studio338 AI Intelligence System",
         "version": "2.0.0",
-        "status": "operational",
+        "status": "operational" if orchestrator is not None else "starting",
         "agents": {
             "ela": "Email Learning Agent",
             "wotson": "WhatsApp Operations Intelligence"
@@ -505,34 +573,107 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
 
+def warm_up():
+    """
+    Serve one synthetic request in-process, without running lifespan, so the
+    routing, validation and serialization state that FastAPI builds lazily on
+    first use already exists when workers are forked.
+    """
+    from fastapi.testclient import TestClient
+    TestClient(app).get("/")
+
+def run_preforked(worker_count: int):
+    """
+    Serve with workers forked from this already-imported process.
+    
+    uvicorn's own workers each start a fresh interpreter and repeat every
+    import; forked workers share the parent's initialized modules copy-on-write.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((settings.API_HOST, settings.API_PORT))
+    sock.set_inheritable(True)
+    
+    config = uvicorn.Config(app, host=settings.API_HOST, port=settings.API_PORT)
+    
+    # Touch the hot paths once here, then move everything allocated so far out
+    # of the collector's reach so garbage collection in the workers does not
+    # write to (and so copy) the shared pages
+    warm_up()
+    gc.freeze()
+    
+    # Hold off SIGTERM/SIGINT until the parent can forward them; one arriving
+    # mid-fork would otherwise kill the parent and orphan the workers forked so far
+    stop_signals = {signal.SIGTERM, signal.SIGINT}
+    signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+    
+    children = []
+    for _ in range(worker_count):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # Own process group, so a terminal Ctrl+C reaches workers only
+                # through the parent and each gets exactly one signal
+                os.setpgid(0, 0)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, stop_signals)
+                uvicorn.Server(config).run(sockets=[sock])
+            finally:
+                # Never fall back into the parent's code path
+                os._exit(0)
+        children.append(pid)
+    
+    sock.close()
+    
+    def forward_signal(signum, frame):
+        """Pass SIGTERM/SIGINT on to every worker so none is left serving as an orphan."""
+        for child in children:
+            try:
+                os.kill(child, signum)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGTERM, forward_signal)
+    signal.signal(signal.SIGINT, forward_signal)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, stop_signals)
+    
+    # waitpid resumes after a handler runs, so the parent stays until every worker has exited
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.API_HOST,
-        port=settings.API_PORT,
-        reload=settings.DEBUG,
-        workers=settings.WORKER_COUNT if not settings.DEBUG else 1
-    )
+    if settings.DEBUG:
+        uvicorn.run("app.main:app", host=settings.API_HOST, port=settings.API_PORT, reload=True)
+    elif settings.WORKER_COUNT > 1 and hasattr(os, "fork"):
+        run_preforked(settings.WORKER_COUNT)
+    else:
+        uvicorn.run(app, host=settings.API_HOST, port=settings.API_PORT)
 '''
-    
+
+def create_main_app(base_path: Path):
+    """Create main FastAPI application file."""
     app_dir = base_path / "app"
     app_dir.mkdir(exist_ok=True)
     
-    with open(app_dir / "main.py", 'w') as f:
-        f.write(main_py)
+    (app_dir / "main.py").write_text(_MAIN_PY_TEXT)
     print("✅ Created app/main.py")
 
-def create_config_file(base_path: Path):
-    """Create configuration management file."""
-    config_py = '''"""
+_CONFIG_PY_TEXT = '''"""
 Configuration management for Studio338 AI Intelligence System
 """
 
-from pydantic_settings import BaseSettings
-from typing import List, Optional
+from pydantic import field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Tuple
+from functools import cached_property, lru_cache
 import os
 from pathlib import Path
 
+import ijson
+import orjson
+
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
@@ -588,62 +729,101 @@ class Settings(BaseSettings):
     
     # Studio338 Specific
     VENUE_NAME: str = "Studio338"
-    KEY_PERSONNEL: List[str] = []
-    EQUIPMENT_CATEGORIES: List[str] = ["audio", "lighting", "staging", "power", "safety"]
-    
-    # Known Events (can be loaded from file or database)
-    KNOWN_EVENTS: dict = {}
+    # Read from the environment as comma-separated strings rather than JSON
+    KEY_PERSONNEL: Annotated[List[str], NoDecode] = []
+    EQUIPMENT_CATEGORIES: Annotated[List[str], NoDecode] = ["audio", "lighting", "staging", "power", "safety"]
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = True
         
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        
-        # Parse comma-separated lists
-        if isinstance(self.KEY_PERSONNEL, str):
-            self.KEY_PERSONNEL = [p.strip() for p in self.KEY_PERSONNEL.split(',')]
-        if isinstance(self.EQUIPMENT_CATEGORIES, str):
-            self.EQUIPMENT_CATEGORIES = [c.strip() for c in self.EQUIPMENT_CATEGORIES.split(',')]
-        
-        # Ensure directories exist
-        self.EXTERNAL_DRIVE_PATH.mkdir(parents=True, exist_ok=True)
+    @field_validator("KEY_PERSONNEL", "EQUIPMENT_CATEGORIES", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value):
+        """Parse comma-separated lists."""
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(',')]
+        return value
+    
+    @model_validator(mode="after")
+    def ensure_directories(self) -> "Settings":
+        """Ensure directories exist; on a mounted drive they usually already do,
+        so a single stat each replaces the parent-by-parent mkdir attempts."""
+        directories = {self.EXTERNAL_DRIVE_PATH}
         if self.LOG_FILE:
-            self.LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            directories.add(self.LOG_FILE.parent)
+        for directory in directories:
+            if not directory.is_dir():
+                os.makedirs(directory, exist_ok=True)
+        return self
+    
+    @cached_property
+    def KNOWN_EVENTS(self) -> dict:
+        """Known events, read from the external drive on first access."""
+        events_file = self.EXTERNAL_DRIVE_PATH / "known_events.json"
+        if events_file.exists():
+            return orjson.loads(events_file.read_bytes())
+        return {}
+    
+    def iter_known_events(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream (event_id, event) pairs from known_events.json.
         
-        # Load known events from file if exists
+        Events are decoded one at a time, so a large file is never held in
+        memory at once; if KNOWN_EVENTS is already loaded it is reused.
+        """
+        if "KNOWN_EVENTS" in self.__dict__:
+            yield from self.KNOWN_EVENTS.items()
+            return
         events_file = self.EXTERNAL_DRIVE_PATH / "known_events.json"
         if events_file.exists():
-            import json
-            with open(events_file) as f:
-                self.KNOWN_EVENTS = json.load(f)
-
-# Create global settings instance
-settings = Settings()
+            with open(events_file, "rb") as f:
+                yield from ijson.kvitems(f, "", use_float=True)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, built on first use."""
+    return Settings()
+
+def __getattr__(name: str):
+    """Keep `from app.config import settings` working without building settings at import."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 '''
-    
-    with open(base_path / "app" / "config.py", 'w') as f:
-        f.write(config_py)
+
+def create_config_file(base_path: Path):
+    """Create configuration management file."""
+    (base_path / "app" / "config.py").write_text(_CONFIG_PY_TEXT)
     print("✅ Created app/config.py")
 
-def initialize_git_repository(base_path: Path):
-    """Initialize git repository and make initial commit."""
-    try:
-        # Initialize git
+INITIAL_COMMIT_MESSAGE = "Initial commit: Studio338 AI Intelligence System structure"
+
+# pygit2 raises GitError, and KeyError when no user.name/user.email is configured
+GIT_ERRORS = (subprocess.CalledProcessError,) + ((pygit2.GitError, KeyError) if pygit2 else ())
+
+def _git_init_and_commit(base_path: Path):
+    """Run git init, add and commit, in-process with pygit2 when it is available."""
+    if pygit2 is None:
         subprocess.run(["git", "init"], cwd=base_path, check=True)
         print("✅ Initialized git repository")
-        
-        # Add all files
         subprocess.run(["git", "add", "."], cwd=base_path, check=True)
-        
-        # Initial commit
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit: Studio338 AI Intelligence System structure"],
-            cwd=base_path,
-            check=True
-        )
+        subprocess.run(["git", "commit", "-m", INITIAL_COMMIT_MESSAGE], cwd=base_path, check=True)
+        return
+    
+    repo = pygit2.init_repository(str(base_path))
+    print("✅ Initialized git repository")
+    repo.index.add_all()
+    repo.index.write()
+    tree = repo.index.write_tree()
+    signature = repo.default_signature
+    repo.create_commit("HEAD", signature, signature, INITIAL_COMMIT_MESSAGE, tree, [])
+
+def initialize_git_repository(base_path: Path):
+    """Initialize git repository and make initial commit."""
+    try:
+        _git_init_and_commit(base_path)
         print("✅ Created initial commit")
         
         # Add origin (user needs to create repo on GitHub first)
@@ -654,15 +834,11 @@ def initialize_git_repository(base_path: Path):
         print(f"   git branch -M main")
         print(f"   git push -u origin main")
         
-    except subprocess.CalledProcessError as e:
+    except GIT_ERRORS as e:
         print(f"❌ Git initialization failed: {e}")
         print("   You may need to install git or configure it properly")
 
-def create_initial_docs(base_path: Path):
-    """Create initial documentation files."""
-    
-    # System Overview
-    system_overview = """# Studio338 AI Intelligence System - Architecture Overview
+_SYSTEM_OVERVIEW_TEXT = """# Studio338 AI Intelligence System - Architecture Overview
 
 ## Introduction
 
@@ -752,16 +928,9 @@ The system runs entirely on local infrastructure:
 - Audit logging for all decisions
 - GDPR-compliant data handling
 """
-    
-    docs_arch_dir = base_path / "docs" / "architecture"
-    docs_arch_dir.mkdir(parents=True, exist_ok=True)
-    
-    with open(docs_arch_dir / "system-overview.md", 'w') as f:
-        f.write(system_overview)
-    print("✅ Created docs/architecture/system-overview.md")
-    
-    # Local Setup Guide
-    local_setup = """# Local Development Setup Guide
+
+# __GITHUB_USERNAME__ is replaced when the guide is written
+_LOCAL_SETUP_TEMPLATE = """# Local Development Setup Guide
 
 ## Prerequisites
 
@@ -774,7 +943,7 @@ The system runs entirely on local infrastructure:
 ## Step 1: Clone Repository
 
 ```bash
-git clone https://github.com/{}/studio338-ai-intelligence.git
+git clone https://github.com/__GITHUB_USERNAME__/studio338-ai-intelligence.git
 cd studio338-ai-intelligence
 ```
 
@@ -881,14 +1050,29 @@ docker-compose up --build
 2. Configure known events: Edit `/Volumes/Studio338Data/known_events.json`
 3. Start monitoring WhatsApp groups
 4. Access dashboard at http://localhost:3000 (when implemented)
-""".format(GITHUB_USERNAME)
-    
+"""
+
+def create_initial_docs(base_path: Path):
+    """Create initial documentation files."""
+    docs_arch_dir = base_path / "docs" / "architecture"
     docs_deploy_dir = base_path / "docs" / "deployment"
+    docs_arch_dir.mkdir(parents=True, exist_ok=True)
     docs_deploy_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(docs_deploy_dir / "local-setup.md", 'w') as f:
-        f.write(local_setup)
-    print("✅ Created docs/deployment/local-setup.md")
+    docs = {
+        # System Overview
+        "architecture/system-overview.md": _SYSTEM_OVERVIEW_TEXT,
+        # Local Setup Guide
+        "deployment/local-setup.md": _LOCAL_SETUP_TEMPLATE.replace("__GITHUB_USERNAME__", GITHUB_USERNAME),
+    }
+    
+    # Both documents are written at once so the second write does not wait
+    # on the first to reach the (often slow, external) volume
+    docs_dir = base_path / "docs"
+    with ThreadPoolExecutor(max_workers=len(docs)) as executor:
+        list(executor.map(lambda doc: (docs_dir / doc[0]).write_text(doc[1]), docs.items()))
+    for relative_path in docs:
+        print(f"✅ Created docs/{relative_path}")
 
 def main():
     """Main setup function."""
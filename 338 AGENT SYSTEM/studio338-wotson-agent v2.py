@@ -7,18 +7,45 @@ identifying urgent situations and coordinating responses with other agents.
 
 import asyncio
 import re
-from typing import Dict, Any, List, Optional, Set
+import sys
+from typing import Dict, Any, Deque, List, Optional, Pattern, Set, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from collections import deque
 import json
 
+from aiohttp import web
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib decoder is used when it is not installed
+    orjson = None
+
 from utils.config import CONFIG
 from modules.query_handler import handle_message_query
+from db.database import log_messages
 from agents.base.base_agent import BaseAgent, AgentType, KnowledgeEntity, A2ATask
 from agents.base.a2a_agent import A2AProtocolManager
 from agents.base.mcp_client import MCPManager
 
-@dataclass
+# Number of recent messages kept per monitored group
+RECENT_MESSAGE_LIMIT = 100
+
+# Urgency pattern weight at which a message skips burst debouncing
+URGENT_BYPASS_WEIGHT = 1.0
+
+# Path the WhatsApp bridge posts incoming messages to
+WEBHOOK_PATH = "/whatsapp-webhook"
+
+# Maximum number of pushed messages waiting to be processed; the webhook blocks when full
+MESSAGE_QUEUE_SIZE = 10_000
+
+# Maximum number of queued messages persisted in one transaction
+MESSAGE_BATCH_SIZE = 100
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+@dataclass(slots=True, frozen=True)
 class WhatsAppMessage:
     """Represents a WhatsApp message with metadata"""
     message_id: str
@@ -27,10 +54,10 @@ class WhatsAppMessage:
     sender: str
     content: str
     timestamp: datetime
-    attachments: List[str] = None
-    mentions: List[str] = None
+    attachments: List[str] = field(default_factory=list)
+    mentions: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class GroupContext:
     """Maintains context for a WhatsApp group"""
     group_id: str
@@ -38,10 +65,20 @@ class GroupContext:
     event_id: Optional[str]
     promoter: Optional[str]
     participants: Set[str]
-    recent_messages: List[WhatsAppMessage]
+    recent_messages: Deque[WhatsAppMessage] = field(default_factory=lambda: deque(maxlen=RECENT_MESSAGE_LIMIT))
     urgency_score: float = 0.0
     last_activity: datetime = None
 
+# Keywords indicating a procedural update, matched in a single scan
+PROCEDURE_UPDATE_PATTERN = re.compile("|".join(
+    re.escape(keyword) for keyword in ["procedure", "protocol", "new way", "do this from now on"]
+))
+
+# Keywords indicating a problem with equipment, matched in a single scan
+EQUIPMENT_ISSUE_PATTERN = re.compile("|".join(
+    re.escape(keyword) for keyword in ["broken", "down", "issue", "fault", "not working", "problem"]
+))
+
 class WotsonWhatsAppAgent(BaseAgent):
     """
     WOTSON - WhatsApp Operations and Tactical Support Operations Network
@@ -60,10 +97,23 @@ class WotsonWhatsAppAgent(BaseAgent):
         
         # Group monitoring state
         self.monitored_groups: Dict[str, GroupContext] = {}
+        
+        # Messages pushed by the WhatsApp bridge wait here until the drain task picks them up
+        self._message_queue: asyncio.Queue = asyncio.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+        self._webhook_runner: Optional[web.AppRunner] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        
+        # Messages from the same sender in quick succession are processed as one burst
+        self._pending_bursts: Dict[Tuple[str, str], List[WhatsAppMessage]] = {}
+        self._burst_timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        self._burst_tasks: Set[asyncio.Task] = set()
         self.urgency_patterns = self._load_urgency_patterns()
         self.equipment_keywords = self._load_equipment_keywords()
+        self.equipment_pattern = self._compile_equipment_pattern(self.equipment_keywords)
+        self._equipment_keywords_lower = [(keyword.lower(), keyword) for keyword in self.equipment_keywords]
         
         # A2A and MCP managers
+        self._agent_card: Optional[Dict[str, Any]] = None
         self.a2a_manager = A2AProtocolManager(self.agent_id, CONFIG.get("a2a_config", {}))
         self.mcp_manager = MCPManager(self.agent_id, CONFIG.get("mcp_config", {}))
         
@@ -96,6 +146,44 @@ class WotsonWhatsAppAgent(BaseAgent):
         await self._setup_ela_collaboration()
         
         self.logger.info("WOTSON initialized successfully")
+    
+    async def shutdown(self) -> None:
+        """
+        Stops WOTSON: closes the webhook so the port is released, then
+        processes every message still queued or held in a burst.
+        """
+        
+        # Stop accepting pushed messages first, so nothing arrives mid-shutdown
+        if self._webhook_runner is not None:
+            await self._webhook_runner.cleanup()
+            self._webhook_runner = None
+        
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        
+        # Messages the drain task had not reached yet still go through the pipeline
+        remaining = []
+        while not self._message_queue.empty():
+            remaining.append(self._message_queue.get_nowait())
+        if remaining:
+            self._handle_message_batch(remaining)
+        
+        # Process held bursts now rather than waiting out their debounce window
+        for timer in self._burst_timers.values():
+            timer.cancel()
+        self._burst_timers.clear()
+        for key in list(self._pending_bursts):
+            self._flush_burst(key)
+        
+        if self._burst_tasks:
+            await asyncio.gather(*self._burst_tasks, return_exceptions=True)
+        
+        self.logger.info("WOTSON shut down")
         
     async def _setup_mcp_tools(self) -> None:
         """Set up MCP tool connections for WhatsApp operations."""
@@ -136,6 +224,13 @@ class WotsonWhatsAppAgent(BaseAgent):
         
     async def generate_agent_card(self) -> Dict[str, Any]:
         """Generate A2A agent card for WOTSON capabilities."""
+        # The card only depends on the agent id and static config, so it is built once
+        if self._agent_card is None:
+            self._agent_card = self._build_agent_card()
+        return self._agent_card
+    
+    def _build_agent_card(self) -> Dict[str, Any]:
+        """Builds the A2A agent card describing WOTSON's skills."""
         return {
             "agentId": self.agent_id,
             "name": "WOTSON - WhatsApp Operations Intelligence",
@@ -248,11 +343,11 @@ class WotsonWhatsAppAgent(BaseAgent):
     
     async def monitor_whatsapp_group(self, group_id: str, group_name: str) -> None:
         """
-        Main monitoring loop for a WhatsApp group.
+        Starts monitoring a WhatsApp group.
         Called when WOTSON is added to a new group or reconnects.
         """
         
-        self.logger.info(f"Starting monitoring of group: {group_name} ({group_id})")
+        self.logger.info("Starting monitoring of group: %s (%s)", group_name, group_id)
         
         # Categorize the group
         event_id, reason = await self._categorize_group(group_id, group_name)
@@ -268,74 +363,232 @@ class WotsonWhatsAppAgent(BaseAgent):
                 group_id=group_id,
                 group_name=group_name,
                 event_id=event_id,
-                participants=set(),
-                recent_messages=[]
+                promoter=None,
+                participants=set()
             )
+    
+    async def _setup_whatsapp_connection(self) -> None:
+        """
+        Starts the webhook the WhatsApp bridge pushes messages to, and the task
+        that drains them. Messages only cost work when they actually arrive.
+        """
+        if self._webhook_runner is not None:
+            return
+        
+        app = web.Application()
+        app.router.add_post(WEBHOOK_PATH, self._handle_webhook)
+        self._webhook_runner = web.AppRunner(app)
+        await self._webhook_runner.setup()
+        
+        port = CONFIG["whatsapp"].get("listen_port", 8000)
+        await web.TCPSite(self._webhook_runner, port=port).start()
+        self._drain_task = asyncio.create_task(self._drain_message_queue())
+        self.logger.info(f"Listening for WhatsApp messages on port {port}{WEBHOOK_PATH}")
+    
+    async def _handle_webhook(self, request: web.Request) -> web.Response:
+        """Queues a message pushed by the WhatsApp bridge."""
+        try:
+            payload = _json_loads(await request.read())
+        except ValueError:
+            return web.json_response({"error": "Invalid JSON payload"}, status=400)
+        if not isinstance(payload, dict):
+            return web.json_response({"error": "Invalid JSON payload"}, status=400)
+        
+        message = self._parse_bridge_message(payload)
+        if message is None:
+            return web.json_response({"status": "ignored"})
+        
+        # Waits when the queue is full, so a surge slows the bridge down instead of growing memory
+        await self._message_queue.put(message)
+        return web.json_response({"status": "queued"})
+    
+    def _parse_bridge_message(self, payload: Dict[str, Any]) -> Optional[WhatsAppMessage]:
+        """Converts a message forwarded by the bridge into a WhatsAppMessage for a monitored group."""
+        key = payload.get("key")
+        if not isinstance(key, dict):
+            return None
+        
+        # Stored messages are keyed by id, so a message without one could not be told apart
+        message_id = key.get("id")
+        if not message_id:
+            return None
+        
+        context = self.monitored_groups.get(key.get("remoteJid"))
+        if context is None:
+            return None
+        
+        body = payload.get("message")
+        if not isinstance(body, dict):
+            return None
+        content = body.get("conversation") or (body.get("extendedTextMessage") or {}).get("text")
+        if not content:
+            return None
         
-        # Start monitoring loop
         try:
-            while self.monitoring_active:
-                new_messages = await self._fetch_new_messages(group_id)
-                for message in new_messages:
-                    await self._process_message(message)
-                
-                # Brief pause before next check
-                await asyncio.sleep(CONFIG.get("agent", {}).get("poll_interval", 5))
-                
+            timestamp = datetime.utcfromtimestamp(int(payload.get("messageTimestamp")))
+        except (TypeError, ValueError):
+            timestamp = datetime.utcnow()
+        
+        # Reuse the group's own strings and intern the sender, so the same few
+        # handles are shared across every message instead of decoded anew each time
+        return WhatsAppMessage(
+            message_id=message_id,
+            group_id=context.group_id,
+            group_name=context.group_name,
+            sender=sys.intern(key.get("participant") or payload.get("pushName") or ""),
+            content=content,
+            timestamp=timestamp
+        )
+    
+    async def _drain_message_queue(self) -> None:
+        """
+        Takes pushed messages off the queue, persists everything that is
+        waiting in one transaction and hands each message to the debouncer.
+        """
+        while True:
+            new_messages = [await self._message_queue.get()]
+            while len(new_messages) < MESSAGE_BATCH_SIZE and not self._message_queue.empty():
+                new_messages.append(self._message_queue.get_nowait())
+            self._handle_message_batch(new_messages)
+    
+    def _handle_message_batch(self, new_messages: List[WhatsAppMessage]) -> None:
+        """Persists a batch of pushed messages in one transaction and debounces each one."""
+        # A failed write (locked or full database) must not stop the messages being processed
+        try:
+            log_messages([
+                {
+                    "message_id": message.message_id,
+                    "group_id": message.group_id,
+                    "group_name": message.group_name,
+                    "sender": message.sender,
+                    "content": message.content,
+                    "timestamp": message.timestamp.isoformat(sep=" ", timespec="seconds"),
+                }
+                for message in new_messages
+            ])
         except Exception as e:
-            self.logger.error(f"Monitoring loop for group {group_id} failed: {e}")
+            self.logger.error("Storing %d pushed messages failed: %s", len(new_messages), e)
+        
+        for message in new_messages:
+            try:
+                self._debounce_message(message)
+            except Exception as e:
+                self.logger.error("Queueing message %s for processing failed: %s", message.message_id, e)
     
-    async def _process_message(self, message: WhatsAppMessage) -> None:
-        """Process a single incoming WhatsApp message by passing it to the query handler."""
+    def _debounce_message(self, message: WhatsAppMessage) -> None:
+        """
+        Holds a message until its sender has been quiet for the debounce window,
+        so a burst of short messages goes through the pipeline once.
+        """
+        key = (message.group_id, message.sender)
+        self._pending_bursts.setdefault(key, []).append(message)
+        
+        timer = self._burst_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        
+        # Clearly urgent messages are not held back
+        if self._is_urgent_burst(message):
+            self._flush_burst(key)
+            return
+        
+        delay = CONFIG.get("agent", {}).get("debounce_ms", 2000) / 1000
+        self._burst_timers[key] = asyncio.get_running_loop().call_later(delay, self._flush_burst, key)
+    
+    def _is_urgent_burst(self, message: WhatsAppMessage) -> bool:
+        """Checks a message against the highest-weight urgency patterns."""
+        return any(
+            pattern.search(message.content)
+            for pattern, weight in self.urgency_patterns
+            if weight >= URGENT_BYPASS_WEIGHT
+        )
+    
+    def _flush_burst(self, key: Tuple[str, str]) -> None:
+        """Processes the pending burst for a (group, sender) pair as one message."""
+        self._burst_timers.pop(key, None)
+        messages = self._pending_bursts.pop(key, None)
+        if not messages:
+            return
+        
+        task = asyncio.create_task(self._process_burst(messages))
+        self._burst_tasks.add(task)
+        task.add_done_callback(self._burst_tasks.discard)
+    
+    async def _process_burst(self, messages: List[WhatsAppMessage]) -> None:
+        """Merges a burst into the latest message and runs it through the pipeline."""
+        message = messages[-1]
+        if len(messages) > 1:
+            message = replace(
+                message,
+                content="\n".join(m.content for m in messages),
+                attachments=[a for m in messages for a in m.attachments],
+                mentions=[u for m in messages for u in m.mentions]
+            )
+        
+        try:
+            await self._process_message(message, messages)
+        except Exception as e:
+            self.logger.error(f"Processing message {message.message_id} failed: {e}")
+    
+    async def _process_message(self, message: WhatsAppMessage, originals: List[WhatsAppMessage]) -> None:
+        """
+        Process an incoming WhatsApp message by passing it to the query handler.
+        For a debounced burst, message is the merged text used for scoring and
+        extraction, and originals are the messages as they were received.
+        """
         
-        # Update group context
-        self.monitored_groups[message.group_id].recent_messages.append(message)
-        self.monitored_groups[message.group_id].last_activity = message.timestamp
+        # Update group context; the group may have stopped being monitored while the message waited.
+        # The group's history keeps the real messages, never the merged one
+        context = self.monitored_groups.get(message.group_id)
+        if context is None:
+            return
+        context.recent_messages.extend(originals)
+        context.last_activity = originals[-1].timestamp
         self.monitoring_stats["messages_processed"] += 1
         
         # Pass to query handler for decision making
-        # The message dataclass needs to be converted to a dict for the handler
-        message_dict = {
-            "message_id": message.message_id,
-            "group_id": message.group_id,
-            "group_name": message.group_name,
-            "sender": message.sender,
-            "content": message.content,
-            "timestamp": message.timestamp.isoformat(),
-            "attachments": message.attachments,
-            "mentions": message.mentions,
-        }
-        
-        action_result = handle_message_query(message_dict, CONFIG)
+        # The handler also takes database rows, so it gets a mapping with just the keys it reads
+        action_result = handle_message_query(
+            {"message_id": message.message_id, "content": message.content}, CONFIG
+        )
         
-        self.logger.info(f"Query handler result for message {message.message_id}: {action_result['action']} - {action_result['details']}")
+        # Lazy %-style arguments, so nothing is formatted when INFO is filtered out
+        self.logger.info(
+            "Query handler result for message %s: %s - %s",
+            message.message_id, action_result["action"], action_result["details"]
+        )
 
+        # Scanned once; shared by the ELA consultation and knowledge extraction
+        equipment_refs = self._extract_equipment_references(message.content)
+        
         # Act on the result from the query handler
         if action_result["action"] == "escalate":
-            await self._handle_urgent_message(message, action_result["urgency_score"])
-        
-        # Extract knowledge if worthy (this logic could also move to the query handler)
-        if await self._is_knowledge_worthy(message):
-            knowledge_entities = await self.extract_knowledge(message)
-            for entity in knowledge_entities:
-                await self.add_knowledge(entity)
-                self.monitoring_stats["knowledge_entities_created"] += 1
+            await self._handle_urgent_message(message, action_result["urgency_score"], equipment_refs)
+        
+        # Extract knowledge; messages with nothing worth keeping yield no entities
+        knowledge_entities = self._extract_message_knowledge(message, equipment_refs)
+        if knowledge_entities:
+            # Store everything from this message in one batch (one broadcast for shared entities)
+            await self.update_knowledge_batch(knowledge_entities)
+            self.monitoring_stats["knowledge_entities_created"] += len(knowledge_entities)
     
-    async def _handle_urgent_message(self, message: WhatsAppMessage, urgency_score: float) -> None:
+    async def _handle_urgent_message(
+        self, message: WhatsAppMessage, urgency_score: float, equipment_refs: List[str]
+    ) -> None:
         """Handles a message identified as urgent by the query handler."""
         self.logger.warning(
-            f"URGENT SITUATION DETECTED in group '{message.group_name}' "
-            f"(Score: {urgency_score:.2f}): '{message.content}'"
+            "URGENT SITUATION DETECTED in group '%s' (Score: %.2f): '%s'",
+            message.group_name, urgency_score, message.content
         )
         # Logic to escalate, e.g., create A2A task, notify admin, etc.
         self.monitoring_stats["urgent_situations_detected"] += 1
 
         # Example: Consult ELA for historical context on similar issues
-        historical_context = await self._get_historical_context(message)
+        historical_context = await self._get_historical_context(message, equipment_refs)
         if historical_context:
-            self.logger.info(f"ELA provided historical context: {historical_context}")
+            self.logger.info("ELA provided historical context: %s", historical_context)
     
-    async def _get_historical_context(self, message: WhatsAppMessage) -> Dict[str, Any]:
+    async def _get_historical_context(self, message: WhatsAppMessage, equipment_refs: List[str]) -> Dict[str, Any]:
         """Consult with ELA for historical context on an urgent issue."""
         self.logger.info("Consulting ELA for historical context...")
         self.monitoring_stats["ela_consultations"] += 1
@@ -346,7 +599,7 @@ class WotsonWhatsAppAgent(BaseAgent):
                 "skill_id": "historical-context",
                 "parameters": {
                     "query": message.content,
-                    "equipment": self._extract_equipment_references(message.content),
+                    "equipment": equipment_refs,
                     "context": {
                         "group": message.group_name,
                         "sender": message.sender
@@ -355,7 +608,7 @@ class WotsonWhatsAppAgent(BaseAgent):
             })
             return response.get("data", {})
         except Exception as e:
-            self.logger.error(f"Failed to get historical context from ELA: {e}")
+            self.logger.error("Failed to get historical context from ELA: %s", e)
             return {}
     
     async def extract_knowledge(self, message: WhatsAppMessage) -> List[KnowledgeEntity]:
@@ -363,13 +616,25 @@ class WotsonWhatsAppAgent(BaseAgent):
         Extracts structured knowledge from a WhatsApp message.
         This could be event details, equipment status, procedural updates, etc.
         """
+        return self._extract_message_knowledge(message, self._extract_equipment_references(message.content))
+    
+    def _extract_message_knowledge(self, message: WhatsAppMessage, equipment_refs: List[str]) -> List[KnowledgeEntity]:
+        """
+        Synchronous body of extract_knowledge. Nothing here awaits, so the
+        per-message pipeline calls it directly instead of creating a coroutine.
+        """
         entities = []
         content_lower = message.content.lower()
+        # One timestamp for every entity extracted from this message
+        now = datetime.utcnow()
+        # The issue type depends only on the message, so it is classified at most once
+        issue_type = None
         
         # Extract equipment-related knowledge
-        equipment_refs = self._extract_equipment_references(message.content)
         for equipment in equipment_refs:
-            if self._is_equipment_issue(message.content, equipment):
+            if self._is_equipment_issue(content_lower, equipment):
+                if issue_type is None:
+                    issue_type = self._classify_equipment_issue(message.content)
                 entity = KnowledgeEntity(
                     entity_id=f"whatsapp_equipment_{equipment}_{message.message_id}",
                     entity_type="equipment",
@@ -377,12 +642,12 @@ class WotsonWhatsAppAgent(BaseAgent):
                     confidence_score=0.8,
                     source_agent=self.agent_type,
                     source_data=[message.message_id],
-                    created_at=datetime.utcnow(),
-                    last_updated=datetime.utcnow(),
+                    created_at=now,
+                    last_updated=now,
                     relationships=[],
                     venue_context={
                         "equipment_type": equipment,
-                        "issue_type": self._classify_equipment_issue(message.content),
+                        "issue_type": issue_type,
                         "reporter": message.sender,
                         "group": message.group_name
                     }
@@ -398,8 +663,8 @@ class WotsonWhatsAppAgent(BaseAgent):
                 confidence_score=0.7,
                 source_agent=self.agent_type,
                 source_data=[message.message_id],
-                created_at=datetime.utcnow(),
-                last_updated=datetime.utcnow(),
+                created_at=now,
+                last_updated=now,
                 relationships=[],
                 venue_context={
                     "update_type": "real-time",
@@ -424,68 +689,43 @@ class WotsonWhatsAppAgent(BaseAgent):
         
         return event_id, reason
     
-    async def _fetch_new_messages(self, group_id: str) -> List[WhatsAppMessage]:
-        """
-        Fetches new messages from a WhatsApp group since the last check.
-        This is a placeholder for the actual WhatsApp API integration.
-        """
-        # In a real implementation, this would connect to the WhatsApp API
-        # and retrieve messages since the last known timestamp.
-        await asyncio.sleep(2) # Simulate network delay
-        return []
-    
     def _extract_equipment_references(self, text: str) -> List[str]:
         """Extract equipment references from message text."""
-        equipment_found = []
-        text_lower = text.lower()
-        
-        for equipment in self.equipment_keywords:
-            if re.search(r'\b' + re.escape(equipment) + r'\b', text, re.IGNORECASE):
-                equipment_found.append(equipment)
-        
-        return equipment_found
+        # One scan over the text finds every keyword; results keep keyword order
+        mentioned = {match.lower() for match in self.equipment_pattern.findall(text)}
+        if not mentioned:
+            return []
+        return [equipment for equipment_lower, equipment in self._equipment_keywords_lower if equipment_lower in mentioned]
     
-    def _is_equipment_issue(self, text: str, equipment: str) -> bool:
-        """Checks if text mentions an issue with a piece of equipment."""
+    def _is_equipment_issue(self, text_lower: str, equipment: str) -> bool:
+        """Checks if already-lowercased text mentions an issue with a piece of equipment."""
         # Simple keyword matching for demonstration
-        issue_keywords = ["broken", "down", "issue", "fault", "not working", "problem"]
-        text_lower = text.lower()
-        if equipment.lower() in text_lower:
-            for keyword in issue_keywords:
-                if keyword in text_lower:
-                    return True
-        return False
+        return equipment.lower() in text_lower and EQUIPMENT_ISSUE_PATTERN.search(text_lower) is not None
     
-    def _load_urgency_patterns(self) -> Dict[str, float]:
-        """Loads urgency patterns from a file or config."""
+    def _load_urgency_patterns(self) -> List[Tuple[Pattern[str], float]]:
+        """Loads urgency patterns from a file or config, compiled once for reuse on every message."""
         # This should come from a config file or a dedicated patterns file.
-        return {
+        raw_patterns = {
             r"\b(urgent|asap|critical)\b": 1.0,
             r"\b(help|issue|problem)\b": 0.8,
             r"\b(down|broken|failed)\b": 0.9,
             r"\b(power cut|power loss|no power)\b": 1.0,
             r"\b(leak|flood|water)\b": 0.95,
         }
+        return [(re.compile(pattern, re.IGNORECASE), weight) for pattern, weight in raw_patterns.items()]
     
     def _load_equipment_keywords(self) -> List[str]:
         """Loads equipment keywords from a file or config."""
         # This should come from a config file.
         return ["Pioneer", "CDJ", "mixer", "lights", "sound system", "generator"]
     
-    async def _is_knowledge_worthy(self, message: WhatsAppMessage) -> bool:
-        """Determines if a message contains valuable information for the knowledge base."""
-        # Simple logic: if it's not urgent but contains equipment names or procedure updates.
-        text = message.content.lower()
-        if self._extract_equipment_references(text):
-            return True
-        if self._contains_procedure_update(text):
-            return True
-        return False
+    @staticmethod
+    def _compile_equipment_pattern(keywords: List[str]) -> Pattern[str]:
+        """Compiles all equipment keywords into a single whole-word alternation."""
+        # Longest first so a keyword is never shadowed by a shorter one it starts with
+        alternatives = sorted((re.escape(keyword) for keyword in keywords), key=len, reverse=True)
+        return re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE)
     
     def _contains_procedure_update(self, text: str) -> bool:
         """Checks for keywords indicating a procedural update."""
-        update_keywords = ["procedure", "protocol", "new way", "do this from now on"]
-        for keyword in update_keywords:
-            if keyword in text:
-                return True
-        return False
\ No newline at end of file
+        return PROCEDURE_UPDATE_PATTERN.search(text) is not None
\ No newline at end of file
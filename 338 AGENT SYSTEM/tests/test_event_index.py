@@ -0,0 +1,81 @@
+"""Tests for EventIndex communication ordering and time windows."""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+_MODULE_PATH = Path(__file__).resolve().parent.parent / "studio338-gateway-indexer v2.latest.py"
+_spec = importlib.util.spec_from_file_location("gateway_indexer", _MODULE_PATH)
+gateway_indexer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gateway_indexer)
+EventIndex = gateway_indexer.EventIndex
+
+
+def _iso_hours_ago(hours: float) -> str:
+    return (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+
+
+class EventIndexOrderingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.index = EventIndex(
+            storage_path=os.path.join(self._tmp.name, "event_index.json"),
+            max_communications=3
+        )
+        self.index.add_event("e1", "Event One")
+
+    def tearDown(self):
+        self.index.close()
+        self._tmp.cleanup()
+
+    def _add(self, text: str, timestamp: str, source: str = "WhatsApp") -> None:
+        self.index.add_communication("e1", {"source": source, "text": text, "timestamp": timestamp})
+
+    def _texts(self, **kwargs):
+        return [c["text"] for c in self.index.get_event_communications("e1", **kwargs)]
+
+    def test_unparseable_timestamp_does_not_evict_parsed_items(self):
+        self._add("old", _iso_hours_ago(30))
+        self._add("recent", _iso_hours_ago(2))
+        self._add("newest", _iso_hours_ago(1))
+        self._add("garbage", "not a timestamp")
+
+        # The buffer is full and the unparseable item is older than everything in it
+        self.assertEqual(self._texts(), ["old", "recent", "newest"])
+
+    def test_unparseable_timestamp_is_kept_before_parsed_items(self):
+        self._add("recent", _iso_hours_ago(2))
+        self._add("garbage", "zzz")
+
+        self.assertEqual(self._texts(), ["garbage", "recent"])
+        self.assertEqual(self._texts(time_window="24h"), ["recent"])
+
+    def test_email_date_header_is_placed_by_parsed_time(self):
+        self._add("recent", _iso_hours_ago(2))
+        self._add("newest", _iso_hours_ago(1))
+        self._add("garbage", "not a timestamp")
+        # RFC 2822, as found in email Date headers; sorts after ISO strings as text
+        email_date = format_datetime(datetime.now(timezone.utc) - timedelta(hours=30))
+        self._add("email", email_date, source="Email")
+
+        self.assertEqual(self._texts(), ["email", "recent", "newest"])
+        self.assertEqual(self._texts(time_window="24h"), ["recent", "newest"])
+        self.assertEqual(self._texts(time_window="7d", source_filter="Email"), ["email"])
+        self.assertEqual(self.index.get_event_summary("e1")["recent_activity_24h"], 2)
+
+    def test_equipment_counted_once_per_message(self):
+        self._add("mixer down, swap the mixer for the spare mixer", _iso_hours_ago(2))
+        self._add("the mixer and the light are fine", _iso_hours_ago(1))
+
+        mentions = self.index.events["e1"]["equipment_mentions"]
+        self.assertEqual(mentions["mixer"], 2)
+        self.assertEqual(mentions["light"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()